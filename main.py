@@ -23,6 +23,7 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.markdown import Markdown
 
+from alphabetum.logging import setup_console_logging
 from alphabetum.loop.engine import AlphabetumLoop
 from alphabetum.state.manager import StateManager
 
@@ -108,7 +109,11 @@ def main():
 
     try:
         loop = AlphabetumLoop(args.path)
-        report = loop.run(max_iterations=args.iterations)
+        listener = setup_console_logging(quiet=args.quiet)
+        try:
+            report = loop.run(max_iterations=args.iterations)
+        finally:
+            listener.stop()
 
         console.print()
         console.print("[bold green]Run completed successfully![/bold green]")
@@ -1,7 +1,7 @@
 """CRITIC agent: evaluates candidate primitives."""
 
 import yaml
-from typing import Any
+from typing import Any, Optional
 
 from .base import BaseAgent
 from ..state.models import IterationState, Candidate, Evaluation, AttackResult, Verdict
@@ -135,16 +135,7 @@ class CriticAgent(BaseAgent):
 ## Candidate to Evaluate
 
 ```yaml
-candidate:
-  id: "{candidate.id}"
-  label: "{candidate.label}"
-  domain: "{candidate.domain.value}"
-  proposed_symbol: "{candidate.proposed_symbol}"
-  informal_definition: "{candidate.informal_definition}"
-  ostensive_examples: {candidate.ostensive_examples}
-  negative_examples: {candidate.negative_examples}
-  primitiveness_argument: "{candidate.primitiveness_argument}"
-  decomposition_resistance: "{candidate.decomposition_resistance}"
+{self._format_candidate(candidate)}
 ```
 
 ## Current Alphabet (for redundancy checking)
@@ -160,8 +151,72 @@ Output your evaluation as valid YAML.
 """
         return prompt
 
-    def parse_response(self, response: str) -> Evaluation:
-        """Parse YAML response into Evaluation object."""
+    def _format_candidate(self, candidate: Candidate) -> str:
+        """Render a candidate as the YAML block shown to the critic."""
+        return (
+            f'candidate:\n'
+            f'  id: "{candidate.id}"\n'
+            f'  label: "{candidate.label}"\n'
+            f'  domain: "{candidate.domain.value}"\n'
+            f'  proposed_symbol: "{candidate.proposed_symbol}"\n'
+            f'  informal_definition: "{candidate.informal_definition}"\n'
+            f'  ostensive_examples: {candidate.ostensive_examples}\n'
+            f'  negative_examples: {candidate.negative_examples}\n'
+            f'  primitiveness_argument: "{candidate.primitiveness_argument}"\n'
+            f'  decomposition_resistance: "{candidate.decomposition_resistance}"'
+        )
+
+    def build_batch_user_prompt(self, state: IterationState, candidates: list[Candidate], **kwargs) -> str:
+        """Build a user prompt asking for evaluations of several candidates at once."""
+        alphabet_summary = kwargs.get("alphabet_summary", "No primitives yet.")
+        blocks = "\n\n".join(
+            f"### Candidate {i}\n\n```yaml\n{self._format_candidate(c)}\n```"
+            for i, c in enumerate(candidates, start=1)
+        )
+
+        return f"""
+## Candidates to Evaluate
+
+{blocks}
+
+## Current Alphabet (for redundancy checking)
+
+{alphabet_summary}
+
+## Your Task
+
+Apply all six attacks to each candidate independently. Be thorough but fair.
+Remember: if a concept truly resists decomposition, that's valuable information.
+
+Output a single YAML document with an `evaluations` list containing one
+entry per candidate, each shaped like the `evaluation` object above, with
+`candidate_id` copied exactly from the candidate's `id`.
+"""
+
+    def execute_batch(
+        self,
+        state: IterationState,
+        candidates: list[Candidate],
+        **kwargs
+    ) -> tuple[list[Optional[Evaluation]], str]:
+        """
+        Evaluate several candidates with a single LLM call.
+
+        Returns:
+            Tuple of (evaluations aligned with candidates, raw_response).
+            An entry is None when the response held no evaluation for that
+            candidate, so the caller can fall back to execute().
+        """
+        system_prompt = self.build_system_prompt(state)
+        user_prompt = self.build_batch_user_prompt(state, candidates, **kwargs)
+
+        raw_response = self.call_llm(system_prompt, user_prompt)
+        by_id = self.parse_batch_response(raw_response)
+
+        return [by_id.get(c.id) for c in candidates], raw_response
+
+    def _extract_yaml(self, response: str) -> str:
+        """Extract the YAML payload from a response, handling markdown code blocks."""
         yaml_content = response
         if "```yaml" in response:
             yaml_content = response.split("```yaml")[1].split("```")[0]
@@ -171,9 +226,29 @@ Output your evaluation as valid YAML.
                 yaml_content = parts[1]
                 if yaml_content.startswith("yaml"):
                     yaml_content = yaml_content[4:]
+        return yaml_content
 
+    def parse_batch_response(self, response: str) -> dict[str, Evaluation]:
+        """Parse a batched YAML response into Evaluations keyed by candidate_id."""
         try:
-            data = yaml.safe_load(yaml_content)
+            data = yaml.safe_load(self._extract_yaml(response))
+        except yaml.YAMLError:
+            return {}
+
+        entries = data.get("evaluations", []) if isinstance(data, dict) else data
+        evaluations = {}
+        for entry in entries if isinstance(entries, list) else []:
+            if not isinstance(entry, dict):
+                continue
+            e = entry.get("evaluation", entry)
+            if isinstance(e, dict) and e.get("candidate_id"):
+                evaluations[str(e["candidate_id"])] = self._parse_evaluation(e)
+        return evaluations
+
+    def parse_response(self, response: str) -> Evaluation:
+        """Parse YAML response into Evaluation object."""
+        try:
+            data = yaml.safe_load(self._extract_yaml(response))
             e = data.get("evaluation", data)  # Handle both nested and flat
         except yaml.YAMLError:
             # Return a default rejection if parsing fails
@@ -184,6 +259,10 @@ Output your evaluation as valid YAML.
                 reasoning_summary="Failed to parse evaluation response"
             )
 
+        return self._parse_evaluation(e)
+
+    def _parse_evaluation(self, e: dict) -> Evaluation:
+        """Build an Evaluation from one parsed evaluation mapping."""
         # Parse decomposition attacks
         decomposition_attacks = []
         decomp = e.get("decomposition", {})
@@ -9,12 +9,23 @@ Computes derived metrics from history snapshots to assess:
 """
 
 from dataclasses import dataclass
-from typing import Optional
+from itertools import accumulate
+from typing import Iterable, Optional
 import math
 
 from .history import HistoryTracker, IterationSnapshot
 
 
+def _prefix_sums(values: Iterable[float]) -> list[float]:
+    """
+    Prefix sums with a leading zero.
+
+    The sum over values[i:j] is prefix[j] - prefix[i], so any window
+    is answered in constant time.
+    """
+    return [0, *accumulate(values)]
+
+
 @dataclass
 class GrowthMetrics:
     """Metrics related to alphabet growth."""
@@ -132,6 +143,8 @@ class MetricsCalculator:
 
         latest = snapshots[-1]
 
+        # The metric families are independent, but each is a short pure-Python
+        # pass over the snapshots; threading them would only add GIL contention.
         return SummaryMetrics(
             iteration=latest.iteration,
             growth=self._calculate_growth(snapshots),
@@ -151,21 +164,21 @@ class MetricsCalculator:
 
         latest = snapshots[-1]
         total = latest.total_primitives
+        n = len(snapshots)
 
         # Calculate recent growth rate (last 5 iterations or available)
-        window = min(5, len(snapshots))
+        window = min(5, n)
         if window < 2:
             growth_rate = latest.primitives_added
             growth_acceleration = 0
         else:
-            recent = snapshots[-window:]
-            recent_growth = sum(s.primitives_added for s in recent)
+            added = _prefix_sums(s.primitives_added for s in snapshots)
+            recent_growth = added[n] - added[n - window]
             growth_rate = recent_growth / window
 
             # Calculate acceleration (change in growth rate)
-            if len(snapshots) >= 2 * window:
-                earlier = snapshots[-2*window:-window]
-                earlier_growth = sum(s.primitives_added for s in earlier) / len(earlier)
+            if n >= 2 * window:
+                earlier_growth = (added[n - window] - added[n - 2 * window]) / window
                 growth_acceleration = growth_rate - earlier_growth
             else:
                 growth_acceleration = 0
@@ -203,12 +216,17 @@ class MetricsCalculator:
             )
 
         latest = snapshots[-1]
+        n = len(snapshots)
+
+        # candidates_proposed is already cumulative, so it serves as its own
+        # prefix-sum column
+        added = _prefix_sums(s.primitives_added for s in snapshots)
+        proposed = [0] + [s.candidates_proposed for s in snapshots]
 
         # Recent acceptance rate (last 5 iterations)
-        window = min(5, len(snapshots))
-        recent = snapshots[-window:]
-        recent_accepted = sum(s.primitives_added for s in recent)
-        recent_proposed = sum(s.candidates_proposed - (snapshots[max(0, snapshots.index(s)-1)].candidates_proposed if snapshots.index(s) > 0 else 0) for s in recent)
+        window = min(5, n)
+        recent_accepted = added[n] - added[n - window]
+        recent_proposed = proposed[n] - proposed[n - window]
 
         if recent_proposed > 0:
             acceptance_rate = recent_accepted / recent_proposed
@@ -216,10 +234,9 @@ class MetricsCalculator:
             acceptance_rate = latest.cumulative_acceptance_rate
 
         # Acceptance trend
-        if len(snapshots) >= 10:
-            earlier_window = snapshots[-10:-5]
-            earlier_accepted = sum(s.primitives_added for s in earlier_window)
-            earlier_proposed = len(earlier_window) * 2  # Approximate
+        if n >= 10:
+            earlier_accepted = added[n - 5] - added[n - 10]
+            earlier_proposed = proposed[n - 5] - proposed[n - 10]
             earlier_rate = earlier_accepted / earlier_proposed if earlier_proposed > 0 else 0
 
             if acceptance_rate > earlier_rate + 0.05:
@@ -232,7 +249,7 @@ class MetricsCalculator:
             acceptance_trend = "stable"
 
         # Productivity
-        total_iterations = len(snapshots)
+        total_iterations = n
         productivity = latest.total_primitives / total_iterations if total_iterations > 0 else 0
 
         # Waste ratio
@@ -348,12 +365,13 @@ class MetricsCalculator:
         latest = snapshots[-1]
 
         # Confidence trend
-        if len(snapshots) >= 5:
-            recent = snapshots[-5:]
-            earlier = snapshots[-10:-5] if len(snapshots) >= 10 else snapshots[:5]
+        n = len(snapshots)
+        if n >= 5:
+            conf = _prefix_sums(s.avg_confidence for s in snapshots)
+            earlier_start = n - 10 if n >= 10 else 0
 
-            recent_conf = sum(s.avg_confidence for s in recent) / len(recent)
-            earlier_conf = sum(s.avg_confidence for s in earlier) / len(earlier)
+            recent_conf = (conf[n] - conf[n - 5]) / 5
+            earlier_conf = (conf[earlier_start + 5] - conf[earlier_start]) / 5
 
             if recent_conf > earlier_conf + 0.02:
                 confidence_trend = "improving"
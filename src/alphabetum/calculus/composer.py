@@ -10,23 +10,49 @@ The core insight: represent primitive concepts as prime numbers.
 from dataclasses import dataclass, field
 from typing import Optional
 import math
+import sys
 from pathlib import Path
 import yaml
 
 from ..state.manager import StateManager
-from ..state.models import PrimitiveIndexEntry
 
 
-@dataclass
+def _tree_product(factors: list[int]) -> int:
+    """
+    Multiply factors pairwise in a balanced tree.
+
+    Keeps operands of similar size so large compositions avoid the
+    quadratic cost of a left fold over a growing bignum.
+    """
+    if not factors:
+        return 1
+    while len(factors) > 1:
+        paired = [factors[i] * factors[i + 1] for i in range(0, len(factors) - 1, 2)]
+        if len(factors) % 2:
+            paired.append(factors[-1])
+        factors = paired
+    return factors[0]
+
+
+@dataclass(slots=True, frozen=True)
 class Concept:
     """A composed concept represented as a product of primes."""
     name: str
     number: int  # Product of prime numbers
-    components: list[str] = field(default_factory=list)  # Labels of primitives
-    negated: list[str] = field(default_factory=list)  # Negated primitives (tracked separately)
+    components: tuple[str, ...] = ()  # Labels of primitives
+    negated: tuple[str, ...] = ()  # Negated primitives (tracked separately)
+    components_set: frozenset[str] = field(init=False, repr=False, compare=False)
+    negated_set: frozenset[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Accept any iterable of labels but store immutable tuples
+        object.__setattr__(self, "components", tuple(self.components))
+        object.__setattr__(self, "negated", tuple(self.negated))
+        object.__setattr__(self, "components_set", frozenset(self.components))
+        object.__setattr__(self, "negated_set", frozenset(self.negated))
 
     def __repr__(self):
-        parts = self.components.copy()
+        parts = list(self.components)
         for neg in self.negated:
             parts.append(f"not-{neg}")
         return f"Concept({self.name} = {' AND '.join(parts)}, n={self.number})"
@@ -39,7 +65,7 @@ class Concept:
 
     def to_expression(self) -> str:
         """Convert to symbolic expression."""
-        parts = self.components.copy()
+        parts = list(self.components)
         for neg in self.negated:
             parts.append(f"not({neg})")
         return " AND ".join(parts) if parts else "EMPTY"
@@ -55,6 +81,15 @@ class Calculus:
 
     def __init__(self, state_manager: Optional[StateManager] = None, base_path: Optional[Path] = None):
         self.state_manager = state_manager
+        self._sorted_primes: Optional[list[tuple[int, str]]] = None  # (prime, label), ascending
+        self._prime_product = 1  # Product of all registered primes
+        self._id_to_label_map: dict[str, str] = {}  # primitive ID -> label
+        self._contrast_index: dict[str, list[str]] = {}  # label -> labels it contrasts with
+        # Memoized results, cleared whenever primitives or contrasts change
+        self._components_cache: dict[int, tuple[str, ...]] = {}
+        self._wellformed_cache: dict[tuple[tuple, frozenset], tuple[bool, list[str]]] = {}
+        # Composition names depend only on the label set, so they never go stale
+        self._name_cache: dict[frozenset[str], str] = {}
         if state_manager:
             self._load_primitives()
         else:
@@ -67,37 +102,51 @@ class Calculus:
         self.primitives = {}
         self.primes_to_labels = {}
         self.contrasts = []
+        self._contrast_index = {}
+        self._sorted_primes = None
+        self._invalidate_caches()
 
         primitives = self.state_manager.load_alphabet_index()
         for p in primitives:
-            self.primitives[p.label] = p.prime
-            self.primes_to_labels[p.prime] = p.label
+            label = sys.intern(p.label)
+            self.primitives[label] = p.prime
+            self.primes_to_labels[p.prime] = label
+        self._id_to_label_map = {p.id: sys.intern(p.label) for p in primitives}
+        self._prime_product = math.prod(self.primitives.values())
 
         # Load contrasts
         relationships = self.state_manager.load_relationships()
         for contrast in relationships.contrasts:
             if isinstance(contrast, (list, tuple)) and len(contrast) == 2:
                 # Get labels from IDs
-                p1_label = self._id_to_label(contrast[0], primitives)
-                p2_label = self._id_to_label(contrast[1], primitives)
+                p1_label = self._id_to_label(contrast[0])
+                p2_label = self._id_to_label(contrast[1])
                 if p1_label and p2_label:
-                    self.contrasts.append((p1_label, p2_label))
+                    self.register_contrast(p1_label, p2_label)
 
-    def _id_to_label(self, primitive_id: str, primitives: list[PrimitiveIndexEntry]) -> Optional[str]:
+    def _id_to_label(self, primitive_id: str) -> Optional[str]:
         """Convert primitive ID to label."""
-        for p in primitives:
-            if p.id == primitive_id:
-                return p.label
-        return None
+        return self._id_to_label_map.get(primitive_id)
+
+    def _invalidate_caches(self) -> None:
+        """Drop memoized decompositions and well-formedness checks."""
+        self._components_cache.clear()
+        self._wellformed_cache.clear()
 
     def register_primitive(self, label: str, prime: int) -> None:
         """Register a primitive concept with its prime number."""
+        label = sys.intern(label)
         self.primitives[label] = prime
         self.primes_to_labels[prime] = label
+        self._sorted_primes = None
+        self._prime_product *= prime
+        self._invalidate_caches()
 
     def register_contrast(self, label1: str, label2: str) -> None:
         """Register that two primitives are contrasting (mutually exclusive)."""
         self.contrasts.append((label1, label2))
+        self._contrast_index.setdefault(label1, []).append(label2)
+        self._wellformed_cache.clear()
 
     def get_prime(self, label: str) -> Optional[int]:
         """Get the prime number for a primitive label."""
@@ -108,22 +157,29 @@ class Calculus:
         Compose multiple primitive concepts into a complex concept.
 
         Example: compose("animal", "rational") -> Concept for HUMAN
+
+        Composition is idempotent: repeated labels are counted once.
         """
-        number = 1
+        factors = []
         components = []
         missing = []
 
-        for label in labels:
+        for label in dict.fromkeys(labels):
             prime = self.primitives.get(label)
             if prime:
-                number *= prime
+                factors.append(prime)
                 components.append(label)
             else:
                 missing.append(label)
 
+        number = _tree_product(factors)
+
         # Generate a name for the composition
         if components:
-            name = "_".join(sorted(components))
+            key = frozenset(components)
+            name = self._name_cache.get(key)
+            if name is None:
+                name = self._name_cache[key] = sys.intern("_".join(sorted(components)))
         else:
             name = "EMPTY"
 
@@ -142,9 +198,13 @@ class Calculus:
         Example: compose_with_negation(["object"], ["living"]) -> INANIMATE
         """
         concept = self.compose(*positives)
-        concept.negated = negatives
-        concept.name = f"{concept.name}_not_{'_'.join(negatives)}" if negatives else concept.name
-        return concept
+        negatives = list(dict.fromkeys(negatives))
+        return Concept(
+            name=f"{concept.name}_not_{'_'.join(negatives)}" if negatives else concept.name,
+            number=concept.number,
+            components=concept.components,
+            negated=negatives,
+        )
 
     def contains(self, complex_concept: Concept, primitive_label: str) -> bool:
         """
@@ -157,15 +217,45 @@ class Calculus:
             return False
         return complex_concept.number % prime == 0
 
-    def extract_components(self, concept: Concept) -> list[str]:
+    def _primes_ascending(self) -> list[tuple[int, str]]:
+        """Registered (prime, label) pairs sorted by prime, cached until the next registration."""
+        if self._sorted_primes is None:
+            self._sorted_primes = sorted((prime, label) for label, prime in self.primitives.items())
+        return self._sorted_primes
+
+    def extract_components(self, concept: Concept) -> tuple[str, ...]:
         """Extract all primitive components from a complex concept."""
-        components = []
-        n = concept.number
+        cached = self._components_cache.get(concept.number)
+        if cached is None:
+            cached = self._components_cache[concept.number] = tuple(self._factor(concept.number))
+        return cached
 
-        for label, prime in self.primitives.items():
-            while n % prime == 0:
-                components.append(label)
-                n //= prime
+    def _factor(self, n: int) -> list[str]:
+        """Decompose n into registered primitive labels, in ascending prime order."""
+        components = []
+        if n < 1:
+            return components
+
+        # Only registered primes that divide n survive in the gcd, so absent
+        # primes are skipped with a cheap test against a small number
+        g = math.gcd(n, self._prime_product)
+        append = components.append
+        primes_to_labels = self.primes_to_labels
+        for prime, label in self._primes_ascending():
+            if g == 1:
+                break
+            if prime * prime > g and g in primes_to_labels:
+                # The gcd has shrunk to a single registered prime
+                prime, label = g, primes_to_labels[g]
+            elif g % prime:
+                continue
+            g //= prime
+            # One divmod per step yields both the quotient and the remainder
+            q, r = divmod(n, prime)
+            while r == 0:
+                append(label)
+                n = q
+                q, r = divmod(n, prime)
 
         return components
 
@@ -175,23 +265,31 @@ class Calculus:
 
         Returns (is_valid, list_of_violations)
         """
+        # Keyed on the ordered components: violations follow component order
+        key = (concept.components, concept.negated_set)
+        cached = self._wellformed_cache.get(key)
+        if cached is not None:
+            return cached[0], list(cached[1])
+
         violations = []
-        components = set(concept.components)
-        negated = set(concept.negated)
+        components = concept.components_set
 
         # Check for P and not-P
-        both = components & negated
+        both = components & concept.negated_set
         if both:
             violations.append(f"Contradiction: both {both} and not-{both}")
 
-        # Check for contrasting primitives
-        for label1, label2 in self.contrasts:
-            if label1 in components and label2 in components:
-                violations.append(f"Contrasting primitives: {label1} and {label2}")
+        # Check for contrasting primitives, looking only at contrasts that
+        # start from a component of this concept, in component order
+        for label1 in dict.fromkeys(concept.components):
+            for label2 in self._contrast_index.get(label1, ()):
+                if label2 in components:
+                    violations.append(f"Contrasting primitives: {label1} and {label2}")
 
-        return len(violations) == 0, violations
+        self._wellformed_cache[key] = (len(violations) == 0, violations)
+        return len(violations) == 0, list(violations)
 
-    def find_common_components(self, c1: Concept, c2: Concept) -> list[str]:
+    def find_common_components(self, c1: Concept, c2: Concept) -> tuple[str, ...]:
         """Find primitives shared by two concepts using GCD."""
         gcd = math.gcd(c1.number, c2.number)
         return self.extract_components(Concept(name="gcd", number=gcd))
@@ -1,5 +1,6 @@
 """Logging and archiving for ALPHABETUM."""
 
 from .archivist import Archivist
+from .console import setup_console_logging
 
-__all__ = ["Archivist"]
+__all__ = ["Archivist", "setup_console_logging"]
@@ -1,10 +1,18 @@
 """Archivist: logs and archives all reasoning for ALPHABETUM."""
 
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional, Any
+from typing import Optional, Any, TextIO
+import functools
+import queue
+import threading
 import yaml
 
+try:
+    from yaml import CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeDumper as _Dumper
+
 from ..state.manager import StateManager
 from ..state.models import (
     Candidate, Evaluation, PrimitiveIndexEntry, PrimitiveDetailed,
@@ -12,103 +20,227 @@ from ..state.models import (
 )
 
 
+def _now_z() -> str:
+    """Current UTC time as an ISO-8601 string with a Z suffix."""
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+NARRATIVE_LEVELS = ("none", "summary", "full")
+
+
+def _truncate(text: str, limit: int, suffix: str = "...") -> str:
+    """Cut text to at most limit characters, marking the cut with suffix."""
+    return text if len(text) <= limit else text[:limit] + suffix
+
+
+def _deferred(method):
+    """Run a log method on the writer thread when background writes are enabled."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self._queue is None:
+            method(self, *args, **kwargs)
+        else:
+            self._queue.put((method, self, args, kwargs))
+    return wrapper
+
+
 class Archivist:
     """
     Captures and preserves all reasoning in both structured (YAML) and narrative (Markdown) formats.
 
     The reasoning IS the product - this class ensures complete transparency and traceability.
+
+    narrative_level controls the Markdown logs: "full" writes everything,
+    "summary" omits raw LLM responses, and "none" writes structured logs only.
+
+    With background=True the log_* calls return immediately and a writer
+    thread performs the disk I/O in call order; flush() waits for it.
     """
 
-    def __init__(self, state_manager: StateManager):
+    def __init__(
+        self,
+        state_manager: StateManager,
+        narrative_level: str = "full",
+        background: bool = False,
+    ):
+        if narrative_level not in NARRATIVE_LEVELS:
+            raise ValueError(
+                f"Unknown narrative level {narrative_level!r}; expected one of {NARRATIVE_LEVELS}"
+            )
         self.state_manager = state_manager
+        self.narrative_level = narrative_level
+        # Structured logs accumulated per record, keyed by (iteration, filename)
+        self._log_buffers: dict[tuple[int, str], dict] = {}
+        # Directories already created during this run
+        self._subdir_cache: dict[str, Path] = {}
+
+        # Pending writes, drained in order by a single writer thread
+        self._queue: Optional[queue.Queue] = None
+        self._write_error: Optional[BaseException] = None
+        if background:
+            self._queue = queue.Queue()
+            threading.Thread(target=self._drain, name="archivist-writer", daemon=True).start()
+
+    def _drain(self) -> None:
+        """Writer thread: perform queued log writes in order."""
+        while True:
+            method, archivist, args, kwargs = self._queue.get()
+            try:
+                method(archivist, *args, **kwargs)
+            except BaseException as e:
+                if self._write_error is None:
+                    self._write_error = e
+            finally:
+                self._queue.task_done()
+
+    def flush(self) -> None:
+        """Wait until all queued writes are on disk, re-raising the first failure."""
+        if self._queue is not None:
+            self._queue.join()
+        if self._write_error is not None:
+            error, self._write_error = self._write_error, None
+            raise error
+
+    def _iter_dir(self, iteration: int) -> Path:
+        """Get the log directory for an iteration, creating it on first use."""
+        return self.state_manager.ensure_iteration_log_dir(iteration)
+
+    def _reasoning_subdir(self, name: str) -> Path:
+        """Get a directory under reasoning/, creating it on first use."""
+        subdir = self._subdir_cache.get(name)
+        if subdir is None:
+            subdir = self._subdir_cache[name] = self.state_manager.reasoning_path / name
+            subdir.mkdir(parents=True, exist_ok=True)
+        return subdir
+
+    def _buffered_entries(self, iteration: int, filename: str, root_key: str, list_key: str) -> list:
+        """
+        Get the in-memory entry list for an accumulating structured log.
+
+        The log is read from disk at most once, so records from an earlier
+        cycle of the same iteration are preserved.
+        """
+        key = (iteration, filename)
+        buffer = self._log_buffers.get(key)
+        if buffer is None:
+            buffer = self.state_manager.load_log(iteration, filename)
+            if buffer is None:
+                buffer = {
+                    root_key: {
+                        "timestamp": _now_z(),
+                        "iteration": iteration,
+                        list_key: []
+                    }
+                }
+            self._log_buffers[key] = buffer
+        return buffer[root_key][list_key]
+
+    @_deferred
+    def flush_iteration(self, iteration: int) -> None:
+        """Write buffered structured logs for an iteration to disk."""
+        for key in [k for k in self._log_buffers if k[0] == iteration]:
+            self.state_manager.save_log(iteration, key[1], self._log_buffers.pop(key))
 
+    @_deferred
     def log_proposer(
         self,
         iteration: int,
         candidates: list[Candidate],
         raw_response: str
     ) -> None:
-        """Log PROPOSER output."""
+        """
+        Log PROPOSER output.
+
+        The structured entries and the narrative are produced in a single
+        pass over the candidates.
+        """
+        timestamp = _now_z()
+
+        if self.narrative_level == "none":
+            structured_candidates = [self._proposer_entry(c) for c in candidates]
+        else:
+            # Narrative log, written while collecting the structured entries
+            structured_candidates = []
+            narrative_path = self._iter_dir(iteration) / "proposer.md"
+            with open(narrative_path, "w") as f:
+                f.write(self._proposer_md_header(iteration, len(candidates), timestamp))
+                for c in candidates:
+                    structured_candidates.append(self._proposer_entry(c))
+                    f.write(self._proposer_md_candidate(c))
+                if self.narrative_level == "full":
+                    f.write(self._proposer_md_tail(raw_response))
+
         # Structured log
         structured = {
             "proposer_output": {
-                "timestamp": datetime.utcnow().isoformat() + "Z",
+                "timestamp": timestamp,
                 "iteration": iteration,
                 "candidates_generated": len(candidates),
-                "candidates": [
-                    {
-                        "id": c.id,
-                        "label": c.label,
-                        "domain": c.domain.value,
-                        "proposed_symbol": c.proposed_symbol,
-                        "confidence": c.confidence,
-                        "definition_preview": c.informal_definition[:100] + "..."
-                        if len(c.informal_definition) > 100 else c.informal_definition,
-                    }
-                    for c in candidates
-                ]
+                "candidates": structured_candidates,
             }
         }
         self.state_manager.save_log(iteration, "proposer.yaml", structured)
 
-        # Narrative log
-        narrative = self._generate_proposer_narrative(iteration, candidates, raw_response)
-        self.state_manager.save_log(iteration, "proposer.md", narrative)
-
-    def _generate_proposer_narrative(
-        self,
-        iteration: int,
-        candidates: list[Candidate],
-        raw_response: str
-    ) -> str:
-        """Generate narrative Markdown for PROPOSER output."""
-        lines = [
-            f"# Proposer Log: Iteration {iteration}",
-            "",
-            f"**Generated:** {datetime.utcnow().isoformat()}Z",
-            f"**Candidates:** {len(candidates)}",
-            "",
-            "---",
-            "",
-        ]
-
-        for c in candidates:
-            lines.extend([
-                f"## Candidate: {c.label.upper()}",
-                "",
-                f"**Domain:** {c.domain.value}",
-                f"**Symbol:** {c.proposed_symbol}",
-                f"**Confidence:** {c.confidence:.2f}",
-                "",
-                "### Definition",
-                "",
-                c.informal_definition,
-                "",
-                "### Examples",
-                "",
-            ])
-            for ex in c.ostensive_examples:
-                lines.append(f"- {ex}")
-            lines.extend([
-                "",
-                "### Primitiveness Argument",
-                "",
-                c.primitiveness_argument,
-                "",
-                "---",
-                "",
-            ])
-
-        lines.extend([
-            "## Raw LLM Response",
-            "",
-            "```",
-            raw_response[:2000] + "..." if len(raw_response) > 2000 else raw_response,
-            "```",
-        ])
-
-        return "\n".join(lines)
+    def _proposer_entry(self, c: Candidate) -> dict:
+        """Structured log entry for one proposed candidate."""
+        return {
+            "id": c.id,
+            "label": c.label,
+            "domain": c.domain.value,
+            "proposed_symbol": c.proposed_symbol,
+            "confidence": c.confidence,
+            "definition_preview": _truncate(c.informal_definition, 100),
+        }
 
+    def _proposer_md_header(self, iteration: int, n_candidates: int, timestamp: str) -> str:
+        """Markdown header block for the PROPOSER narrative."""
+        return (
+            f"# Proposer Log: Iteration {iteration}\n"
+            "\n"
+            f"**Generated:** {timestamp}\n"
+            f"**Candidates:** {n_candidates}\n"
+            "\n"
+            "---\n"
+            "\n"
+        )
+
+    def _proposer_md_candidate(self, c: Candidate) -> str:
+        """Markdown block for one candidate in the PROPOSER narrative."""
+        examples = "".join(f"- {ex}\n" for ex in c.ostensive_examples)
+        return (
+            f"## Candidate: {c.label.upper()}\n"
+            "\n"
+            f"**Domain:** {c.domain.value}\n"
+            f"**Symbol:** {c.proposed_symbol}\n"
+            f"**Confidence:** {c.confidence:.2f}\n"
+            "\n"
+            "### Definition\n"
+            "\n"
+            f"{c.informal_definition}\n"
+            "\n"
+            "### Examples\n"
+            "\n"
+            f"{examples}"
+            "\n"
+            "### Primitiveness Argument\n"
+            "\n"
+            f"{c.primitiveness_argument}\n"
+            "\n"
+            "---\n"
+            "\n"
+        )
+
+    def _proposer_md_tail(self, raw_response: str) -> str:
+        """Markdown raw-response block closing the PROPOSER narrative."""
+        return (
+            "## Raw LLM Response\n"
+            "\n"
+            "```\n"
+            f"{_truncate(raw_response, 2000)}\n"
+            "```"
+        )
+
+    @_deferred
     def log_critic(
         self,
         iteration: int,
@@ -116,20 +248,13 @@ class Archivist:
         evaluation: Evaluation,
         raw_response: str
     ) -> None:
-        """Log CRITIC output for a single candidate."""
-        # Load existing or create new
-        existing = self.state_manager.load_log(iteration, "critic.yaml")
-        if existing is None:
-            existing = {
-                "critic_output": {
-                    "timestamp": datetime.utcnow().isoformat() + "Z",
-                    "iteration": iteration,
-                    "evaluations": []
-                }
-            }
+        """
+        Log CRITIC output for a single candidate.
 
-        # Add this evaluation
-        existing["critic_output"]["evaluations"].append({
+        The structured entry is buffered until flush_iteration().
+        """
+        evaluations = self._buffered_entries(iteration, "critic.yaml", "critic_output", "evaluations")
+        evaluations.append({
             "candidate_id": evaluation.candidate_id,
             "verdict": evaluation.verdict.value,
             "confidence": evaluation.confidence,
@@ -138,26 +263,23 @@ class Archivist:
             "redundancy_can_be_expressed": evaluation.redundancy_can_be_expressed,
             "cultural_assessment": evaluation.cultural_assessment,
             "parsimony_necessary": evaluation.parsimony_necessary,
-            "reasoning_summary": evaluation.reasoning_summary[:200] if evaluation.reasoning_summary else "",
+            "reasoning_summary": _truncate(evaluation.reasoning_summary or "", 200, suffix=""),
             "key_insight": evaluation.key_insight,
         })
 
-        self.state_manager.save_log(iteration, "critic.yaml", existing)
-
         # Append to narrative log
-        narrative_path = self.state_manager.ensure_iteration_log_dir(iteration) / "critic.md"
-        narrative = self._generate_critic_narrative(candidate_id, evaluation, raw_response)
-
-        with open(narrative_path, "a") as f:
-            f.write(narrative)
+        if self.narrative_level != "none":
+            narrative_path = self._iter_dir(iteration) / "critic.md"
+            with open(narrative_path, "a") as f:
+                self._write_critic_narrative(f, candidate_id, evaluation)
 
-    def _generate_critic_narrative(
+    def _write_critic_narrative(
         self,
+        f: TextIO,
         candidate_id: str,
-        evaluation: Evaluation,
-        raw_response: str
-    ) -> str:
-        """Generate narrative Markdown for a CRITIC evaluation."""
+        evaluation: Evaluation
+    ) -> None:
+        """Write narrative Markdown for a CRITIC evaluation to a text stream."""
         verdict_emoji = {
             Verdict.ACCEPT: "ACCEPT",
             Verdict.REJECT: "REJECT",
@@ -165,41 +287,37 @@ class Archivist:
             Verdict.DEFER: "DEFER",
         }
 
-        lines = [
-            f"## Evaluation: {candidate_id}",
-            "",
-            f"**Verdict:** {verdict_emoji.get(evaluation.verdict, evaluation.verdict.value)}",
-            f"**Confidence:** {evaluation.confidence:.2f}",
-            "",
-            "### Attack Results",
-            "",
-            f"- Decomposition Survived: {'Yes' if evaluation.decomposition_survived else 'No'}",
-            f"- Circularity Survived: {'Yes' if evaluation.circularity_survived else 'No'}",
-            f"- Can Be Expressed via Others: {'Yes' if evaluation.redundancy_can_be_expressed else 'No'}",
-            f"- Cultural Assessment: {evaluation.cultural_assessment}",
-            f"- Parsimony Necessary: {'Yes' if evaluation.parsimony_necessary else 'No'}",
-            "",
-            "### Reasoning Summary",
-            "",
-            evaluation.reasoning_summary or "(No summary provided)",
-            "",
-        ]
+        f.write(
+            f"## Evaluation: {candidate_id}\n"
+            "\n"
+            f"**Verdict:** {verdict_emoji.get(evaluation.verdict, evaluation.verdict.value)}\n"
+            f"**Confidence:** {evaluation.confidence:.2f}\n"
+            "\n"
+            "### Attack Results\n"
+            "\n"
+            f"- Decomposition Survived: {'Yes' if evaluation.decomposition_survived else 'No'}\n"
+            f"- Circularity Survived: {'Yes' if evaluation.circularity_survived else 'No'}\n"
+            f"- Can Be Expressed via Others: {'Yes' if evaluation.redundancy_can_be_expressed else 'No'}\n"
+            f"- Cultural Assessment: {evaluation.cultural_assessment}\n"
+            f"- Parsimony Necessary: {'Yes' if evaluation.parsimony_necessary else 'No'}\n"
+            "\n"
+            "### Reasoning Summary\n"
+            "\n"
+            f"{evaluation.reasoning_summary or '(No summary provided)'}\n"
+            "\n"
+        )
 
         if evaluation.key_insight:
-            lines.extend([
-                "### Key Insight",
-                "",
-                f"> {evaluation.key_insight}",
-                "",
-            ])
+            f.write(
+                "### Key Insight\n"
+                "\n"
+                f"> {evaluation.key_insight}\n"
+                "\n"
+            )
 
-        lines.extend([
-            "---",
-            "",
-        ])
-
-        return "\n".join(lines)
+        f.write("---\n")
 
+    @_deferred
     def log_refiner(
         self,
         iteration: int,
@@ -207,20 +325,13 @@ class Archivist:
         detailed: PrimitiveDetailed,
         raw_response: str
     ) -> None:
-        """Log REFINER integration of an accepted primitive."""
-        # Load existing or create new
-        existing = self.state_manager.load_log(iteration, "refiner.yaml")
-        if existing is None:
-            existing = {
-                "refiner_output": {
-                    "timestamp": datetime.utcnow().isoformat() + "Z",
-                    "iteration": iteration,
-                    "integrations": []
-                }
-            }
+        """
+        Log REFINER integration of an accepted primitive.
 
-        # Add this integration
-        existing["refiner_output"]["integrations"].append({
+        The structured entry is buffered until flush_iteration().
+        """
+        integrations = self._buffered_entries(iteration, "refiner.yaml", "refiner_output", "integrations")
+        integrations.append({
             "primitive_id": index_entry.id,
             "label": index_entry.label,
             "domain": index_entry.domain.value,
@@ -237,68 +348,65 @@ class Archivist:
             }
         })
 
-        self.state_manager.save_log(iteration, "refiner.yaml", existing)
-
         # Narrative log
-        narrative = self._generate_refiner_narrative(index_entry, detailed)
-        narrative_path = self.state_manager.ensure_iteration_log_dir(iteration) / "refiner.md"
-        with open(narrative_path, "a") as f:
-            f.write(narrative)
+        if self.narrative_level != "none":
+            narrative_path = self._iter_dir(iteration) / "refiner.md"
+            with open(narrative_path, "a") as f:
+                self._write_refiner_narrative(f, index_entry, detailed)
 
-    def _generate_refiner_narrative(
+    def _write_refiner_narrative(
         self,
+        f: TextIO,
         index_entry: PrimitiveIndexEntry,
         detailed: PrimitiveDetailed
-    ) -> str:
-        """Generate narrative Markdown for REFINER integration."""
-        lines = [
-            f"## Integrated: {detailed.label.upper()} ({index_entry.id})",
-            "",
-            f"**Prime Number:** {index_entry.prime}",
-            f"**Symbol:** {detailed.symbol}",
-            f"**Domain:** {index_entry.domain.value}",
-            "",
-            "### Definition",
-            "",
-            detailed.definition.informal,
-            "",
-            "### Relationships",
-            "",
-        ]
+    ) -> None:
+        """Write narrative Markdown for REFINER integration to a text stream."""
+        f.write(
+            f"## Integrated: {detailed.label.upper()} ({index_entry.id})\n"
+            "\n"
+            f"**Prime Number:** {index_entry.prime}\n"
+            f"**Symbol:** {detailed.symbol}\n"
+            f"**Domain:** {index_entry.domain.value}\n"
+            "\n"
+            "### Definition\n"
+            "\n"
+            f"{detailed.definition.informal}\n"
+            "\n"
+            "### Relationships\n"
+            "\n"
+        )
 
         if detailed.contrasts_with:
-            lines.append("**Contrasts with:**")
-            for r in detailed.contrasts_with:
-                lines.append(f"- {r.label} ({r.id}): {r.reason}")
-            lines.append("")
+            f.write("**Contrasts with:**\n")
+            f.write("".join(f"- {r.label} ({r.id}): {r.reason}\n" for r in detailed.contrasts_with))
+            f.write("\n")
 
         if detailed.presupposes:
-            lines.append("**Presupposes:**")
-            for r in detailed.presupposes:
-                lines.append(f"- {r.label} ({r.id}): {r.reason}")
-            lines.append("")
-
-        lines.extend([
-            "---",
-            "",
-        ])
+            f.write("**Presupposes:**\n")
+            f.write("".join(f"- {r.label} ({r.id}): {r.reason}\n" for r in detailed.presupposes))
+            f.write("\n")
 
-        return "\n".join(lines)
+        f.write("---\n")
 
+    @_deferred
     def log_rejection(
         self,
         iteration: int,
         candidate: Candidate,
         evaluation: Evaluation
     ) -> None:
-        """Log a rejected candidate."""
+        """
+        Log a rejected candidate.
+
+        Rejections are appended as separate YAML documents to one file per
+        iteration, reasoning/rejected/iteration_NNN.yaml.
+        """
         # Save to rejections directory
-        reject_dir = self.state_manager.reasoning_path / "rejected"
-        reject_dir.mkdir(parents=True, exist_ok=True)
+        reject_dir = self._reasoning_subdir("rejected")
 
         rejection = {
             "rejection": {
-                "timestamp": datetime.utcnow().isoformat() + "Z",
+                "timestamp": _now_z(),
                 "iteration": iteration,
                 "candidate": {
                     "id": candidate.id,
@@ -315,11 +423,14 @@ class Archivist:
             }
         }
 
-        filename = f"{candidate.id}_{candidate.label}.yaml"
-        filepath = reject_dir / filename
-        with open(filepath, "w") as f:
-            yaml.dump(rejection, f, default_flow_style=False, sort_keys=False)
+        filepath = reject_dir / f"iteration_{iteration:03d}.yaml"
+        with open(filepath, "a") as f:
+            yaml.dump_all(
+                [rejection], f, Dumper=_Dumper, explicit_start=True,
+                default_flow_style=False, sort_keys=False
+            )
 
+    @_deferred
     def log_consolidation(
         self,
         iteration: int,
@@ -329,7 +440,7 @@ class Archivist:
         """Log CONSOLIDATION phase results."""
         structured = {
             "consolidation_output": {
-                "timestamp": datetime.utcnow().isoformat() + "Z",
+                "timestamp": _now_z(),
                 "iteration": iteration,
                 "issues_found": len(issues),
                 "issues": issues,
@@ -338,6 +449,7 @@ class Archivist:
         }
         self.state_manager.save_log(iteration, "consolidation.yaml", structured)
 
+    @_deferred
     def log_composition(
         self,
         iteration: int,
@@ -348,7 +460,7 @@ class Archivist:
         """Log COMPOSITION phase results."""
         structured = {
             "composition_output": {
-                "timestamp": datetime.utcnow().isoformat() + "Z",
+                "timestamp": _now_z(),
                 "iteration": iteration,
                 "concepts_tested": len(concepts_tested),
                 "expressible": expressible_count,
@@ -358,6 +470,7 @@ class Archivist:
         }
         self.state_manager.save_log(iteration, "composition.yaml", structured)
 
+    @_deferred
     def log_meta_reflection(
         self,
         iteration: int,
@@ -366,8 +479,7 @@ class Archivist:
     ) -> None:
         """Log META-REFLECTION output."""
         # Save to meta_reflections directory
-        reflect_dir = self.state_manager.reasoning_path / "meta_reflections"
-        reflect_dir.mkdir(parents=True, exist_ok=True)
+        reflect_dir = self._reasoning_subdir("meta_reflections")
 
         structured = {
             "meta_reflection": {
@@ -398,72 +510,79 @@ class Archivist:
         filename = f"{reflection.id}_iteration_{iteration:03d}.yaml"
         filepath = reflect_dir / filename
         with open(filepath, "w") as f:
-            yaml.dump(structured, f, default_flow_style=False, sort_keys=False)
+            yaml.dump(structured, f, Dumper=_Dumper, default_flow_style=False, sort_keys=False)
 
         # Also save to iteration log
         self.state_manager.save_log(iteration, "meta_reflection.yaml", structured)
 
         # Generate narrative
-        narrative = self._generate_meta_narrative(reflection, raw_response)
-        self.state_manager.save_log(iteration, "meta_reflection.md", narrative)
-
-    def _generate_meta_narrative(
+        if self.narrative_level != "none":
+            narrative_path = self._iter_dir(iteration) / "meta_reflection.md"
+            with open(narrative_path, "w") as f:
+                self._write_meta_narrative(
+                    f, reflection, raw_response,
+                    include_raw=self.narrative_level == "full",
+                )
+
+    def _write_meta_narrative(
         self,
+        f: TextIO,
         reflection: MetaReflection,
-        raw_response: str
-    ) -> str:
-        """Generate narrative Markdown for META-REFLECTION."""
-        lines = [
-            f"# Meta-Reflection: {reflection.id}",
-            "",
-            f"**Generated:** {reflection.timestamp.isoformat()}Z",
-            f"**Iteration Range:** {reflection.iteration_range[0]} - {reflection.iteration_range[1]}",
-            "",
-            "---",
-            "",
-            "## Progress Assessment",
-            "",
-            f"- Primitives Added: {reflection.primitives_added}",
-            f"- Acceptance Rate: {reflection.acceptance_rate:.1%}",
-            f"- Coverage Before: {reflection.coverage_before:.1%}",
-            f"- Coverage After: {reflection.coverage_after:.1%}",
-            "",
-            "## Strategy Assessment",
-            "",
-            f"- PROPOSER Effectiveness: {reflection.proposer_effectiveness}/5",
-            f"- CRITIC Calibration: {reflection.critic_calibration}",
-            "",
-            "## Decision",
-            "",
-            f"**{reflection.decision}**",
-            "",
-            reflection.decision_justification,
-            "",
-        ]
+        raw_response: str,
+        include_raw: bool = True
+    ) -> None:
+        """Write narrative Markdown for META-REFLECTION to a text stream."""
+        f.write(
+            f"# Meta-Reflection: {reflection.id}\n"
+            "\n"
+            f"**Generated:** {reflection.timestamp.isoformat()}Z\n"
+            f"**Iteration Range:** {reflection.iteration_range[0]} - {reflection.iteration_range[1]}\n"
+            "\n"
+            "---\n"
+            "\n"
+            "## Progress Assessment\n"
+            "\n"
+            f"- Primitives Added: {reflection.primitives_added}\n"
+            f"- Acceptance Rate: {reflection.acceptance_rate:.1%}\n"
+            f"- Coverage Before: {reflection.coverage_before:.1%}\n"
+            f"- Coverage After: {reflection.coverage_after:.1%}\n"
+            "\n"
+            "## Strategy Assessment\n"
+            "\n"
+            f"- PROPOSER Effectiveness: {reflection.proposer_effectiveness}/5\n"
+            f"- CRITIC Calibration: {reflection.critic_calibration}\n"
+            "\n"
+            "## Decision\n"
+            "\n"
+            f"**{reflection.decision}**\n"
+            "\n"
+            f"{reflection.decision_justification}\n"
+            "\n"
+        )
 
         if reflection.insights:
-            lines.extend([
-                "## Insights for Archive",
-                "",
-            ])
+            f.write("## Insights for Archive\n\n")
             for i in reflection.insights:
                 category = i.get("category", "general")
                 insight = i.get("insight", str(i))
-                lines.append(f"- [{category}] {insight}")
-            lines.append("")
-
-        lines.extend([
-            "---",
-            "",
-            "## Raw Response",
-            "",
-            "```",
-            raw_response[:3000] + "..." if len(raw_response) > 3000 else raw_response,
-            "```",
-        ])
-
-        return "\n".join(lines)
-
+                f.write(f"- [{category}] {insight}\n")
+            f.write("\n")
+
+        if not include_raw:
+            return
+
+        raw = _truncate(raw_response, 3000)
+        f.write(
+            "---\n"
+            "\n"
+            "## Raw Response\n"
+            "\n"
+            "```\n"
+            f"{raw}\n"
+            "```"
+        )
+
+    @_deferred
     def log_iteration_summary(
         self,
         iteration: int,
@@ -477,7 +596,7 @@ class Archivist:
         summary = {
             "iteration_summary": {
                 "iteration": iteration,
-                "timestamp": datetime.utcnow().isoformat() + "Z",
+                "timestamp": _now_z(),
                 "candidates": {
                     "proposed": candidates_proposed,
                     "accepted": candidates_accepted,
@@ -0,0 +1,29 @@
+"""Console output for the loop, routed through the standard logging module."""
+
+import logging
+import logging.handlers
+import queue
+import sys
+
+
+def setup_console_logging(quiet: bool = False) -> logging.handlers.QueueListener:
+    """
+    Send ``alphabetum`` log records to stdout through a queue.
+
+    Emitting threads only enqueue records; a single listener thread formats
+    and writes them, so concurrent agent calls never wait on stdout. Call
+    ``stop()`` on the returned listener to flush remaining output.
+    """
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    listener = logging.handlers.QueueListener(log_queue, handler)
+
+    logger = logging.getLogger("alphabetum")
+    logger.handlers = [logging.handlers.QueueHandler(log_queue)]
+    logger.setLevel(logging.WARNING if quiet else logging.INFO)
+    logger.propagate = False
+
+    listener.start()
+    return listener
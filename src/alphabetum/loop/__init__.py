@@ -1,5 +1,5 @@
 """Loop engine for ALPHABETUM."""
 
-from .engine import AlphabetumLoop
+from .engine import AlphabetumLoop, LoopConfig
 
-__all__ = ["AlphabetumLoop"]
+__all__ = ["AlphabetumLoop", "LoopConfig"]
@@ -1,10 +1,19 @@
 """Main loop engine for ALPHABETUM."""
 
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+import logging
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
+from typing import Callable, Iterable, Optional, TypeVar
 import yaml
 
+try:
+    from yaml import CSafeDumper as _Dumper, CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeDumper as _Dumper, SafeLoader as _Loader
+
 from ..state.manager import StateManager
 from ..state.models import (
     IterationState, Phase, Verdict, Domain,
@@ -14,6 +23,54 @@ from ..agents import ProposerAgent, CriticAgent, RefinerAgent, MetaReasonerAgent
 from ..logging import Archivist
 from ..analytics.expressiveness import ExpressivenessAnalyzer
 
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Iterations looked back over by META-REFLECTION
+META_LOOKBACK = 5
+
+# Phase that follows each phase once its cycles are complete
+_NEXT_PHASE = {
+    Phase.EXPANSION: Phase.CONSOLIDATION,
+    Phase.CONSOLIDATION: Phase.COMPOSITION,
+    Phase.COMPOSITION: Phase.META_REFLECTION,
+    Phase.META_REFLECTION: Phase.EXPANSION,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class LoopConfig:
+    """Loop settings read once from the ``iteration`` and ``stopping`` config sections."""
+    candidates_per_cycle: int
+    expansion_cycles: int
+    consolidation_cycles: int
+    composition_cycles: int
+    max_iterations: int
+    coverage_threshold: float
+    stability_window: int
+    max_parallel_agents: int = 4
+    acceptance_window: int = 20
+    batch_critic: bool = False
+
+    @classmethod
+    def from_dict(cls, config: dict) -> "LoopConfig":
+        iteration = config["iteration"]
+        stopping = config["stopping"]
+        return cls(
+            candidates_per_cycle=iteration["candidates_per_cycle"],
+            expansion_cycles=iteration["expansion_cycles"],
+            consolidation_cycles=iteration["consolidation_cycles"],
+            composition_cycles=iteration["composition_cycles"],
+            max_iterations=stopping["max_iterations"],
+            coverage_threshold=stopping["coverage_threshold"],
+            stability_window=stopping["stability_window"],
+            max_parallel_agents=iteration.get("max_parallel_agents", 4),
+            acceptance_window=iteration.get("acceptance_window", 20),
+            batch_critic=iteration.get("batch_critic", False),
+        )
+
 
 class AlphabetumLoop:
     """Main orchestration engine for the Alphabet of Human Thought construction."""
@@ -22,6 +79,7 @@ class AlphabetumLoop:
         self.base_path = Path(base_path)
         self.state_manager = StateManager(base_path)
         self.config = config or self.state_manager.load_config()
+        self.loop_config = LoopConfig.from_dict(self.config)
 
         # Initialize agents
         self.proposer = ProposerAgent(self.config)
@@ -30,7 +88,39 @@ class AlphabetumLoop:
         self.meta_reasoner = MetaReasonerAgent(self.config)
 
         # Initialize archivist
-        self.archivist = Archivist(self.state_manager)
+        self.archivist = Archivist(
+            self.state_manager,
+            narrative_level=self.config.get("logging", {}).get("narrative_level", "full"),
+            background=True,
+        )
+
+        # Cycles to run in each phase before moving on
+        self._cycle_limits = {
+            Phase.EXPANSION: self.loop_config.expansion_cycles,
+            Phase.CONSOLIDATION: self.loop_config.consolidation_cycles,
+            Phase.COMPOSITION: self.loop_config.composition_cycles,
+            Phase.META_REFLECTION: 1,
+        }
+
+        # Handler for one cycle of each phase
+        self._phase_handlers = {
+            Phase.EXPANSION: self._expansion_phase,
+            Phase.CONSOLIDATION: self._consolidation_phase,
+            Phase.COMPOSITION: self._composition_phase,
+            Phase.META_REFLECTION: self._meta_reflection_phase,
+        }
+
+        # Alphabet summary keyed on the index file's (mtime_ns, size)
+        self._summary_cache: Optional[tuple[tuple[int, int], str]] = None
+
+        # Parsed benchmarks keyed on the benchmark file's (mtime_ns, size)
+        self._benchmarks_cache: Optional[tuple[tuple[int, int], list[dict]]] = None
+
+        # Alphabet/corpus version and corpus coverage of the last metrics run
+        self._last_metrics: Optional[tuple[tuple, float]] = None
+
+        # Iteration summaries already read for meta-reflection, oldest first
+        self._recent_summaries: deque[tuple[int, dict]] = deque(maxlen=META_LOOKBACK + 1)
 
     def run(self, max_iterations: Optional[int] = None) -> dict:
         """
@@ -40,46 +130,50 @@ class AlphabetumLoop:
             Final report dictionary
         """
         if max_iterations is None:
-            max_iterations = self.config["stopping"]["max_iterations"]
+            max_iterations = self.loop_config.max_iterations
 
         state = self.state_manager.load_iteration_state()
-        print(f"Starting ALPHABETUM at iteration {state.current_iteration}")
-        print(f"Current phase: {state.phase.value}")
+        logger.info("Starting ALPHABETUM at iteration %d", state.current_iteration)
+        logger.info("Current phase: %s", state.phase.value)
 
         while not self._should_stop(state, max_iterations):
-            print(f"\n{'='*60}")
-            print(f"ITERATION {state.current_iteration} | Phase: {state.phase.value} | Cycle: {state.cycle_in_phase}")
-            print(f"{'='*60}")
+            logger.info(
+                "\n%s\nITERATION %d | Phase: %s | Cycle: %d\n%s",
+                "=" * 60, state.current_iteration, state.phase.value, state.cycle_in_phase, "=" * 60,
+            )
 
             # Execute current phase
-            if state.phase == Phase.EXPANSION:
-                state = self._expansion_phase(state)
-            elif state.phase == Phase.CONSOLIDATION:
-                state = self._consolidation_phase(state)
-            elif state.phase == Phase.COMPOSITION:
-                state = self._composition_phase(state)
-            elif state.phase == Phase.META_REFLECTION:
-                state = self._meta_reflection_phase(state)
+            state = self._phase_handlers[state.phase](state)
+
+            # Write structured logs buffered during the phase, and let queued
+            # writes land before the state that refers to them is saved
+            self.archivist.flush_iteration(state.current_iteration)
+            self.archivist.flush()
 
             # Update cycle/phase counters
+            phase = state.phase
             state = self._advance_state(state)
 
-            # Save state
-            self.state_manager.save_iteration_state(state)
+            # Save state: a full snapshot at phase transitions, otherwise
+            # just journal the fields a cycle can change
+            if state.phase != phase:
+                self.state_manager.save_iteration_state(state)
+            else:
+                self.state_manager.append_state_delta(state)
 
         # Generate final report
         return self._generate_final_report(state)
 
     def _expansion_phase(self, state: IterationState) -> IterationState:
         """Execute one cycle of the EXPANSION phase."""
-        print(f"\n--- EXPANSION Cycle {state.cycle_in_phase + 1} ---")
+        logger.info("\n--- EXPANSION Cycle %d ---", state.cycle_in_phase + 1)
 
         # Get alphabet summary for context
         alphabet_summary = self._get_alphabet_summary()
 
         # PROPOSER generates candidates
-        n_candidates = self.config["iteration"]["candidates_per_cycle"]
-        print(f"PROPOSER generating {n_candidates} candidates...")
+        n_candidates = self.loop_config.candidates_per_cycle
+        logger.info("PROPOSER generating %d candidates...", n_candidates)
 
         candidates, proposer_raw = self.proposer.execute(
             state,
@@ -92,44 +186,65 @@ class AlphabetumLoop:
         for i, c in enumerate(candidates):
             c.id = f"CAND_{state.current_iteration:03d}_{i:03d}"
 
-        print(f"  Generated {len(candidates)} candidates: {[c.label for c in candidates]}")
+        logger.info("  Generated %d candidates: %s", len(candidates), [c.label for c in candidates])
 
         # Log proposer output
         self.archivist.log_proposer(state.current_iteration, candidates, proposer_raw)
 
         state.total_proposed += len(candidates)
 
-        # CRITIC evaluates each candidate
-        evaluations = []
-        for candidate in candidates:
-            print(f"\nCRITIC evaluating '{candidate.label}'...")
-
-            evaluation, critic_raw = self.critic.execute(
-                state,
-                candidate=candidate,
-                alphabet_summary=alphabet_summary,
+        # CRITIC evaluates each candidate, either in one batched request or
+        # with independent concurrent calls; results keep proposal order.
+        logger.info("\nCRITIC evaluating %d candidates...", len(candidates))
+        if self.loop_config.batch_critic and len(candidates) > 1:
+            critiques = self._critique_batch(state, candidates, alphabet_summary)
+        else:
+            critiques = self._map_parallel(
+                lambda c: self.critic.execute(
+                    state,
+                    candidate=c,
+                    alphabet_summary=alphabet_summary,
+                ),
+                candidates,
             )
+
+        evaluations = []
+        for candidate, (evaluation, critic_raw) in zip(candidates, critiques):
             evaluation.candidate_id = candidate.id
             evaluations.append((candidate, evaluation))
 
             # Log critic output
             self.archivist.log_critic(state.current_iteration, candidate.id, evaluation, critic_raw)
 
-            print(f"  Verdict: {evaluation.verdict.value} (confidence: {evaluation.confidence:.2f})")
+            logger.info(
+                "\n  '%s' verdict: %s (confidence: %.2f)",
+                candidate.label, evaluation.verdict.value, evaluation.confidence,
+            )
             if evaluation.key_insight:
-                print(f"  Key insight: {evaluation.key_insight}")
+                logger.info("  Key insight: %s", evaluation.key_insight)
+
+        # REFINER suggests relationships for accepted candidates. The LLM calls
+        # all see the same alphabet summary, so they run concurrently; the
+        # integration below assigns IDs and primes and stays sequential.
+        accepted = [c for c, e in evaluations if e.verdict == Verdict.ACCEPT]
+        if accepted:
+            logger.info("\nREFINER relating %d accepted candidates...", len(accepted))
+        suggestions = dict(zip(
+            (c.id for c in accepted),
+            self._map_parallel(
+                lambda c: self.refiner.execute(
+                    state,
+                    candidate=c,
+                    alphabet_summary=alphabet_summary,
+                ),
+                accepted,
+            ),
+        ))
 
-        # REFINER integrates accepted candidates
         for candidate, evaluation in evaluations:
             if evaluation.verdict == Verdict.ACCEPT:
-                print(f"\nREFINER integrating '{candidate.label}'...")
-
-                # Get relationship suggestions
-                relationships, refiner_raw = self.refiner.execute(
-                    state,
-                    candidate=candidate,
-                    alphabet_summary=alphabet_summary,
-                )
+                logger.info("\nREFINER integrating '%s'...", candidate.label)
+                relationships, refiner_raw = suggestions[candidate.id]
 
                 # Integrate into alphabet
                 index_entry, detailed = self.refiner.integrate_primitive(
@@ -144,8 +259,9 @@ class AlphabetumLoop:
                     refiner_raw
                 )
 
+                self._summary_cache = None
                 state.total_accepted += 1
-                print(f"  Assigned ID: {index_entry.id}, Prime: {index_entry.prime}")
+                logger.info("  Assigned ID: %s, Prime: %d", index_entry.id, index_entry.prime)
 
             elif evaluation.verdict == Verdict.REJECT:
                 state.total_rejected += 1
@@ -156,23 +272,67 @@ class AlphabetumLoop:
                     evaluation
                 )
 
-        # Update acceptance rate
-        if state.total_proposed > 0:
-            state.recent_acceptance_rate = state.total_accepted / state.total_proposed
+        # Update acceptance rate over the last acceptance_window verdicts
+        verdicts = state.recent_verdicts + [e.verdict == Verdict.ACCEPT for _, e in evaluations]
+        state.recent_verdicts = verdicts[-self.loop_config.acceptance_window:]
+        if state.recent_verdicts:
+            state.recent_acceptance_rate = sum(state.recent_verdicts) / len(state.recent_verdicts)
 
         return state
 
+    def _critique_batch(
+        self,
+        state: IterationState,
+        candidates: list[Candidate],
+        alphabet_summary: str,
+    ) -> list[tuple]:
+        """Evaluate candidates in one CRITIC call, retrying any it missed individually."""
+        evaluations, critic_raw = self.critic.execute_batch(
+            state,
+            candidates,
+            alphabet_summary=alphabet_summary,
+        )
+
+        missing = [c for c, e in zip(candidates, evaluations) if e is None]
+        if missing:
+            logger.info("  Batch response missed %d candidates; evaluating them individually", len(missing))
+        retried = dict(zip(
+            (c.id for c in missing),
+            self._map_parallel(
+                lambda c: self.critic.execute(
+                    state,
+                    candidate=c,
+                    alphabet_summary=alphabet_summary,
+                ),
+                missing,
+            ),
+        ))
+
+        return [
+            (e, critic_raw) if e is not None else retried[c.id]
+            for c, e in zip(candidates, evaluations)
+        ]
+
+    def _map_parallel(self, fn: Callable[[T], R], items: Iterable[T]) -> list[R]:
+        """Apply an agent call to each item concurrently, preserving order."""
+        items = list(items)
+        workers = min(self.loop_config.max_parallel_agents, len(items))
+        if workers <= 1:
+            return [fn(item) for item in items]
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(fn, items))
+
     def _consolidation_phase(self, state: IterationState) -> IterationState:
         """Execute one cycle of the CONSOLIDATION phase."""
-        print(f"\n--- CONSOLIDATION Cycle {state.cycle_in_phase + 1} ---")
+        logger.info("\n--- CONSOLIDATION Cycle %d ---", state.cycle_in_phase + 1)
 
         # Check for consistency issues
         issues = self.refiner.check_consistency(state)
 
         if issues:
-            print(f"  Found {len(issues)} consistency issues:")
+            logger.info("  Found %d consistency issues:", len(issues))
             for issue in issues:
-                print(f"    - {issue['type']}: {issue}")
+                logger.info("    - %s: %s", issue["type"], issue)
 
             # Log issues
             self.archivist.log_consolidation(
@@ -181,17 +341,17 @@ class AlphabetumLoop:
                 []  # Resolutions would go here
             )
         else:
-            print("  No consistency issues found.")
+            logger.info("  No consistency issues found.")
 
         return state
 
     def _composition_phase(self, state: IterationState) -> IterationState:
         """Execute one cycle of the COMPOSITION phase."""
-        print(f"\n--- COMPOSITION Cycle {state.cycle_in_phase + 1} ---")
+        logger.info("\n--- COMPOSITION Cycle %d ---", state.cycle_in_phase + 1)
 
         # Load benchmarks
         benchmarks = self._load_benchmarks()
-        primitives = self.state_manager.load_alphabet_index()
+        primitive_labels = self.state_manager.load_primitive_labels()
 
         # Test a subset of benchmarks
         n_test = min(5, len(benchmarks))
@@ -202,32 +362,28 @@ class AlphabetumLoop:
 
         for concept in test_concepts:
             # Simple expressibility check: do we have primitives that could compose this?
-            hints = concept.get("decomposition_hints", [])
-            primitive_labels = {p.label for p in primitives}
-
-            matched = [h for h in hints if h in primitive_labels]
-            coverage = len(matched) / len(hints) if hints else 0
+            hint_set = concept["_hint_set"]
+            n_matched = len(hint_set & primitive_labels)
+            coverage = n_matched / len(hint_set) if hint_set else 0
 
             if coverage >= 0.7:
                 expressible += 1
                 status = "expressible"
-            elif coverage >= 0.3:
-                status = "partial"
-                gaps.extend([h for h in hints if h not in primitive_labels])
             else:
-                status = "inexpressible"
-                gaps.extend([h for h in hints if h not in primitive_labels])
+                status = "partial" if coverage >= 0.3 else "inexpressible"
+                # Walk the hint list rather than the set to keep gaps in order
+                gaps.extend(h for h in concept.get("decomposition_hints", []) if h not in primitive_labels)
 
-            print(f"  {concept['name']}: {status} (matched {len(matched)}/{len(hints)} hints)")
+            logger.info("  %s: %s (matched %d/%d hints)", concept["name"], status, n_matched, len(hint_set))
 
         # Update coverage score
         state.coverage_score = expressible / n_test if n_test > 0 else 0
-        print(f"\n  Coverage score: {state.coverage_score:.2%}")
+        logger.info("\n  Coverage score: %.2f%%", state.coverage_score * 100)
 
         # Store unique gaps for next expansion
-        state.gaps_to_fill = list(set(gaps))[:10]
+        state.gaps_to_fill = list(dict.fromkeys(gaps))[:10]
         if state.gaps_to_fill:
-            print(f"  Gaps identified: {state.gaps_to_fill}")
+            logger.info("  Gaps identified: %s", state.gaps_to_fill)
 
         # Log composition results
         self.archivist.log_composition(
@@ -241,12 +397,12 @@ class AlphabetumLoop:
 
     def _meta_reflection_phase(self, state: IterationState) -> IterationState:
         """Execute the META-REFLECTION phase."""
-        print(f"\n--- META-REFLECTION ---")
+        logger.info("\n--- META-REFLECTION ---")
 
-        start_iteration = max(0, state.current_iteration - 5)
+        start_iteration = max(0, state.current_iteration - META_LOOKBACK)
 
         # Get recent logs summary
-        recent_logs = self._get_recent_logs_summary(start_iteration)
+        recent_logs = self._get_recent_logs_summary(start_iteration, state.current_iteration)
 
         # Execute meta-reasoner
         reflection, raw_response = self.meta_reasoner.execute(
@@ -258,13 +414,13 @@ class AlphabetumLoop:
 
         reflection.iteration_range = (start_iteration, state.current_iteration)
 
-        print(f"  Decision: {reflection.decision}")
-        print(f"  Justification: {reflection.decision_justification[:100]}...")
+        logger.info("  Decision: %s", reflection.decision)
+        logger.info("  Justification: %s...", reflection.decision_justification[:100])
 
         # Apply adjustments
         if reflection.decision == "CONTINUE":
             state = self.meta_reasoner.apply_adjustments(state, reflection)
-            print(f"  Applied adjustments. New priorities: {[d.value for d in state.domains_priority]}")
+            logger.info("  Applied adjustments. New priorities: %s", [d.value for d in state.domains_priority])
 
         # Log reflection
         self.archivist.log_meta_reflection(
@@ -275,57 +431,57 @@ class AlphabetumLoop:
 
         # Handle decision
         if reflection.decision == "CONCLUDE":
-            print("\n  META-REASONER recommends CONCLUSION.")
+            logger.info("\n  META-REASONER recommends CONCLUSION.")
             # This will trigger stop condition
 
         return state
 
     def _advance_state(self, state: IterationState) -> IterationState:
         """Advance cycle/phase counters after a cycle."""
-        config = self.config["iteration"]
-
-        cycle_limits = {
-            Phase.EXPANSION: config["expansion_cycles"],
-            Phase.CONSOLIDATION: config["consolidation_cycles"],
-            Phase.COMPOSITION: config["composition_cycles"],
-            Phase.META_REFLECTION: 1,
-        }
-
         state.cycle_in_phase += 1
 
         # Check if phase is complete
-        if state.cycle_in_phase >= cycle_limits[state.phase]:
+        if state.cycle_in_phase >= self._cycle_limits[state.phase]:
             state.cycle_in_phase = 0
 
             # Transition to next phase
-            phase_order = [Phase.EXPANSION, Phase.CONSOLIDATION, Phase.COMPOSITION, Phase.META_REFLECTION]
-            current_idx = phase_order.index(state.phase)
-            next_idx = (current_idx + 1) % len(phase_order)
-            state.phase = phase_order[next_idx]
+            state.phase = _NEXT_PHASE[state.phase]
 
             # If we've completed a full cycle, increment iteration
             if state.phase == Phase.EXPANSION:
                 # Run expressiveness metrics before advancing
                 self._compute_expressiveness_metrics(state)
                 state.current_iteration += 1
-                print(f"\n>>> Advancing to iteration {state.current_iteration}")
+                logger.info("\n>>> Advancing to iteration %d", state.current_iteration)
 
         return state
 
     def _compute_expressiveness_metrics(self, state: IterationState) -> None:
         """Compute and save expressiveness metrics for the iteration."""
-        print(f"\n--- EXPRESSIVENESS METRICS ---")
+        logger.info("\n--- EXPRESSIVENESS METRICS ---")
 
         try:
+            # The analysis depends only on the alphabet index and the corpus
+            corpus_file = self.base_path / "validation" / "corpora" / "logical_treatises.yaml"
+            corpus_stat = corpus_file.stat() if corpus_file.exists() else None
+            version = (
+                self.state_manager.index_version(),
+                corpus_stat and (corpus_stat.st_mtime_ns, corpus_stat.st_size),
+            )
+            if self._last_metrics is not None and self._last_metrics[0] == version:
+                logger.info("  [SKIP] Metrics unchanged since the last iteration")
+                state.coverage_score = max(state.coverage_score, self._last_metrics[1])
+                return
+
             analyzer = ExpressivenessAnalyzer(self.state_manager)
             metrics = analyzer.analyze()
 
             # Print summary
-            print(f"  Corpus Coverage: {metrics.corpus_coverage:.1%}")
-            print(f"  Concepts Expressible: {metrics.concepts_expressible}")
-            print(f"  Shannon Entropy: {metrics.shannon_entropy:.3f}")
-            print(f"  Bits per Concept: {metrics.bits_per_concept:.2f}")
-            print(f"  MDL Score: {metrics.mdl_score:.4f}")
+            logger.info("  Corpus Coverage: %.1f%%", metrics.corpus_coverage * 100)
+            logger.info("  Concepts Expressible: %s", metrics.concepts_expressible)
+            logger.info("  Shannon Entropy: %.3f", metrics.shannon_entropy)
+            logger.info("  Bits per Concept: %.2f", metrics.bits_per_concept)
+            logger.info("  MDL Score: %.4f", metrics.mdl_score)
 
             # Save report
             report = analyzer.generate_report(state.current_iteration)
@@ -337,7 +493,7 @@ class AlphabetumLoop:
 
             yaml_path = reports_dir / f"iteration_{state.current_iteration:03d}.yaml"
             with open(yaml_path, "w") as f:
-                yaml.dump(report, f, default_flow_style=False, sort_keys=False)
+                yaml.dump(report, f, Dumper=_Dumper, default_flow_style=False, sort_keys=False)
 
             # Also save encoding table
             md_content = analyzer.generate_encoding_table()
@@ -345,34 +501,33 @@ class AlphabetumLoop:
             with open(md_path, "w") as f:
                 f.write(md_content)
 
-            print(f"  Reports saved to: {reports_dir}")
+            logger.info("  Reports saved to: %s", reports_dir)
 
             # Append to history
             analyzer.append_to_history(state.current_iteration)
-            print(f"  History updated")
+            logger.info("  History updated")
 
             # Update state with expressiveness coverage
             state.coverage_score = max(state.coverage_score, metrics.corpus_coverage)
+            self._last_metrics = (version, metrics.corpus_coverage)
 
         except Exception as e:
-            print(f"  [WARN] Could not compute expressiveness metrics: {e}")
+            logger.warning("  [WARN] Could not compute expressiveness metrics: %s", e)
 
     def _should_stop(self, state: IterationState, max_iterations: int) -> bool:
         """Check if any stopping condition is met."""
-        config = self.config["stopping"]
-
         # Check max iterations
         if state.current_iteration >= max_iterations:
-            print("\n[STOP] Maximum iterations reached")
+            logger.info("\n[STOP] Maximum iterations reached")
             return True
 
         # Check coverage threshold
-        if state.coverage_score >= config["coverage_threshold"]:
-            print(f"\n[STOP] Coverage threshold reached: {state.coverage_score:.2%}")
+        if state.coverage_score >= self.loop_config.coverage_threshold:
+            logger.info("\n[STOP] Coverage threshold reached: %.2f%%", state.coverage_score * 100)
             return True
 
         # Check stability (no primitives added in window)
-        if state.current_iteration > config["stability_window"]:
+        if state.current_iteration > self.loop_config.stability_window:
             # This would need more sophisticated tracking
             pass
 
@@ -380,42 +535,61 @@ class AlphabetumLoop:
 
     def _get_alphabet_summary(self) -> str:
         """Get a summary of current primitives for context."""
-        primitives = self.state_manager.load_alphabet_index()
+        version = self.state_manager.index_version()
+        if self._summary_cache is not None and self._summary_cache[0] == version:
+            return self._summary_cache[1]
+
+        summary = self._build_alphabet_summary(self.state_manager.load_alphabet_index())
+        self._summary_cache = (version, summary)
+        return summary
 
+    def _build_alphabet_summary(self, primitives: list[PrimitiveIndexEntry]) -> str:
+        """Render the alphabet summary text for a list of primitives."""
         if not primitives:
             return "The alphabet is empty. No primitives have been accepted yet."
 
-        lines = [f"Current alphabet has {len(primitives)} primitives:\n"]
-
         # Group by domain
-        by_domain: dict[str, list] = {}
+        by_domain: defaultdict[str, list[str]] = defaultdict(list)
         for p in primitives:
-            domain = p.domain.value
-            if domain not in by_domain:
-                by_domain[domain] = []
-            by_domain[domain].append(p.label)
-
-        for domain, labels in sorted(by_domain.items()):
-            lines.append(f"  {domain}: {', '.join(labels)}")
+            by_domain[p.domain.value].append(p.label)
 
+        lines = [f"Current alphabet has {len(primitives)} primitives:\n"]
+        lines.extend(
+            f"  {domain}: {', '.join(labels)}" for domain, labels in sorted(by_domain.items())
+        )
         return "\n".join(lines)
 
     def _load_benchmarks(self) -> list[dict]:
-        """Load benchmark concepts."""
+        """Load benchmark concepts, reparsing only when the file changes."""
         benchmarks_file = self.base_path / "validation" / "benchmarks" / "test_concepts.yaml"
-        with open(benchmarks_file) as f:
-            data = yaml.safe_load(f)
-        return data.get("benchmark_concepts", [])
-
-    def _get_recent_logs_summary(self, start_iteration: int) -> str:
+        stat = benchmarks_file.stat()
+        version = (stat.st_mtime_ns, stat.st_size)
+        if self._benchmarks_cache is not None and self._benchmarks_cache[0] == version:
+            return self._benchmarks_cache[1]
+
+        with open(benchmarks_file, "rb") as f:
+            data = yaml.load(f, Loader=_Loader)
+        benchmarks = data.get("benchmark_concepts", [])
+        for concept in benchmarks:
+            concept["_hint_set"] = frozenset(concept.get("decomposition_hints", []))
+        self._benchmarks_cache = (version, benchmarks)
+        return benchmarks
+
+    def _get_recent_logs_summary(self, start_iteration: int, current_iteration: int) -> str:
         """Get summary of recent logs for meta-reflection."""
+        seen = dict(self._recent_summaries)
         lines = []
 
-        state = self.state_manager.load_iteration_state()
-        for i in range(start_iteration, state.current_iteration + 1):
-            summary = self.state_manager.load_log(i, "summary.yaml")
-            if summary:
-                lines.append(f"Iteration {i}: {summary.get('highlights', ['no highlights'])}")
+        for i in range(start_iteration, current_iteration + 1):
+            summary = seen.get(i)
+            if summary is None:
+                # Completed iterations' summaries never change, so each is read once
+                summary = self.state_manager.load_log(i, "summary.yaml")
+                if not summary:
+                    continue
+                self._recent_summaries.append((i, summary))
+            body = summary.get("iteration_summary", summary)
+            lines.append(f"Iteration {i}: {body.get('highlights', ['no highlights'])}")
 
         return "\n".join(lines) if lines else "No recent logs available."
 
@@ -448,7 +622,7 @@ class AlphabetumLoop:
         # Save final report
         report_path = self.base_path / "FINAL_REPORT.yaml"
         with open(report_path, "w") as f:
-            yaml.dump(report, f, default_flow_style=False, sort_keys=False)
+            yaml.dump(report, f, Dumper=_Dumper, default_flow_style=False, sort_keys=False)
 
-        print(f"\nFinal report saved to: {report_path}")
+        logger.info("\nFinal report saved to: %s", report_path)
         return report
@@ -1,13 +1,26 @@
 """State management for the alphabet and reasoning logs."""
 
+import bisect
+import functools
+import hashlib
+import json
+import os
 import yaml
+from collections import Counter
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
 
+from pydantic import TypeAdapter
+
+try:
+    from yaml import CSafeDumper as _Dumper, CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeDumper as _Dumper, SafeLoader as _Loader
+
 from .models import (
     IterationState, PrimitiveIndexEntry, PrimitiveDetailed,
-    Phase, Domain, PrimitiveStatus, Definition, RelationshipGraph
+    Phase, Domain, PrimitiveStatus, RelationshipGraph
 )
 
 
@@ -27,9 +40,43 @@ def _represent_status(dumper, status):
 
 
 # Register custom representers
-yaml.add_representer(Domain, _represent_domain)
-yaml.add_representer(Phase, _represent_phase)
-yaml.add_representer(PrimitiveStatus, _represent_status)
+for _dumper in (yaml.Dumper, _Dumper):
+    yaml.add_representer(Domain, _represent_domain, Dumper=_dumper)
+    yaml.add_representer(Phase, _represent_phase, Dumper=_dumper)
+    yaml.add_representer(PrimitiveStatus, _represent_status, Dumper=_dumper)
+
+
+_INDEX_ADAPTER = TypeAdapter(list[PrimitiveIndexEntry])
+
+# Initial sieve bound for prime assignment; doubled when the alphabet outgrows it
+_SIEVE_START = 1 << 12
+
+
+@functools.cache
+def _primes_up_to(limit: int) -> list[int]:
+    """All primes <= limit, by a sieve of Eratosthenes."""
+    sieve = bytearray([1]) * (limit + 1)
+    sieve[:2] = b"\x00\x00"
+    for i in range(2, int(limit ** 0.5) + 1):
+        if sieve[i]:
+            sieve[i * i::i] = bytes(len(range(i * i, limit + 1, i)))
+    return [i for i, is_prime in enumerate(sieve) if is_prime]
+
+
+# IterationState fields that change between phase transitions; these are
+# journaled per cycle instead of rewriting the whole state snapshot
+_STATE_DELTA_FIELDS = (
+    "cycle_in_phase",
+    "candidates_to_evaluate",
+    "gaps_to_fill",
+    "coverage_score",
+    "consistency_score",
+    "recent_acceptance_rate",
+    "recent_verdicts",
+    "total_proposed",
+    "total_accepted",
+    "total_rejected",
+)
 
 
 class StateManager:
@@ -42,42 +89,109 @@ class StateManager:
         self.calculus_path = self.base_path / "calculus"
         self.validation_path = self.base_path / "validation"
 
+        # Parsed alphabet index and primitive labels, keyed on the index file version
+        self._index_cache: Optional[tuple[tuple[int, int], list[PrimitiveIndexEntry]]] = None
+        self._labels_cache: Optional[tuple[tuple[int, int], frozenset[str]]] = None
+        # Detailed-file lookup by id, keyed on the detailed directory's mtime
+        self._detailed_paths: Optional[tuple[int, dict[str, Path]]] = None
+        # Payload digest of the last write per file, keyed on that write's file version
+        self._written_digests: dict[Path, tuple[tuple[int, int], bytes]] = {}
+        # Iteration log directories already created
+        self._log_dirs: dict[int, Path] = {}
+
     # === ITERATION STATE ===
 
     def load_iteration_state(self) -> IterationState:
-        """Load current iteration state from YAML."""
+        """Load current iteration state from YAML, applying any journaled cycle updates."""
         state_file = self.reasoning_path / "iteration_state.yaml"
-        with open(state_file) as f:
-            data = yaml.safe_load(f)
-        return self._parse_iteration_state(data["iteration_state"])
+        with open(state_file, "rb") as f:
+            data = yaml.load(f, Loader=_Loader)
+        state = self._parse_iteration_state(data["iteration_state"])
+
+        delta = self._last_state_delta()
+        if delta is not None:
+            for field in _STATE_DELTA_FIELDS:
+                setattr(state, field, delta[field])
+        return state
 
     def save_iteration_state(self, state: IterationState) -> None:
         """Save iteration state to YAML."""
         state_file = self.reasoning_path / "iteration_state.yaml"
         state.last_updated = datetime.utcnow()
         data = {"iteration_state": self._serialize_iteration_state(state)}
-        with open(state_file, "w") as f:
-            yaml.dump(data, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+        self._write_yaml_if_changed(state_file, data, data["iteration_state"])
+        self._state_journal_file().unlink(missing_ok=True)
+
+    def append_state_delta(self, state: IterationState) -> None:
+        """
+        Journal the per-cycle fields of state without rewriting the snapshot.
+
+        Each line carries the full value of every field in _STATE_DELTA_FIELDS,
+        tagged with the snapshot it applies to, so only the last line is
+        replayed. The journal is cleared by the next save_iteration_state.
+        """
+        delta = {field: getattr(state, field) for field in _STATE_DELTA_FIELDS}
+        delta["snapshot"] = list(self._state_snapshot_version())
+        with open(self._state_journal_file(), "a") as f:
+            f.write(json.dumps(delta) + "\n")
+
+    def _state_journal_file(self) -> Path:
+        return self.reasoning_path / "iteration_state.journal"
+
+    def _state_snapshot_version(self) -> tuple[int, int]:
+        stat = (self.reasoning_path / "iteration_state.yaml").stat()
+        return stat.st_mtime_ns, stat.st_size
+
+    def _last_state_delta(self) -> Optional[dict]:
+        """Get the newest journaled delta that applies to the current snapshot."""
+        journal = self._state_journal_file()
+        if not journal.exists():
+            return None
+
+        snapshot = list(self._state_snapshot_version())
+        with open(journal) as f:
+            lines = f.read().splitlines()
+        for line in reversed(lines):
+            try:
+                delta = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # torn write from an interrupted run
+            # A snapshot rewritten by another tool makes the journal stale
+            return delta if delta.get("snapshot") == snapshot else None
+        return None
 
     # === ALPHABET ===
 
     def load_alphabet_index(self) -> list[PrimitiveIndexEntry]:
-        """Load the alphabet index."""
-        index_file = self.alphabet_path / "primitives" / "index.yaml"
-        with open(index_file) as f:
-            data = yaml.safe_load(f)
-        return [
-            PrimitiveIndexEntry(**self._parse_primitive_entry(p))
-            for p in data["alphabet_index"].get("primitives", [])
-        ]
-
-    def _parse_primitive_entry(self, p: dict) -> dict:
-        """Parse a primitive entry, converting string enums."""
-        return {
-            **p,
-            "domain": Domain(p["domain"]) if isinstance(p["domain"], str) else p["domain"],
-            "status": PrimitiveStatus(p["status"]) if isinstance(p["status"], str) else p["status"],
-        }
+        """
+        Load the alphabet index, reparsing only when the file has changed.
+
+        The returned list is new on every call, but its entries are shared
+        with the cache; change them only via save_alphabet_index.
+        """
+        version = self.index_version()
+        if self._index_cache is None or self._index_cache[0] != version:
+            index_file = self.alphabet_path / "primitives" / "index.yaml"
+            with open(index_file, "rb") as f:
+                data = yaml.load(f, Loader=_Loader)
+            primitives = _INDEX_ADAPTER.validate_python(
+                data["alphabet_index"].get("primitives", [])
+            )
+            self._index_cache = (version, primitives)
+        return list(self._index_cache[1])
+
+    def index_version(self) -> tuple[int, int]:
+        """Return a cheap change token for the alphabet index file."""
+        stat = (self.alphabet_path / "primitives" / "index.yaml").stat()
+        return stat.st_mtime_ns, stat.st_size
+
+    def load_primitive_labels(self) -> frozenset[str]:
+        """Return the set of primitive labels, cached until the index changes."""
+        version = self.index_version()
+        if self._labels_cache is None or self._labels_cache[0] != version:
+            labels = frozenset(p.label for p in self.load_alphabet_index())
+            self._labels_cache = (version, labels)
+        return self._labels_cache[1]
 
     def save_alphabet_index(
         self,
@@ -88,14 +202,9 @@ class StateManager:
         index_file = self.alphabet_path / "primitives" / "index.yaml"
 
         # Compute statistics
-        by_domain: dict[str, int] = {}
-        by_status = {"stable": 0, "recent": 0, "contested": 0}
-
-        for p in primitives:
-            domain = p.domain.value
-            by_domain[domain] = by_domain.get(domain, 0) + 1
-            if p.status.value in by_status:
-                by_status[p.status.value] = by_status.get(p.status.value, 0) + 1
+        by_domain = dict(Counter(p.domain.value for p in primitives))
+        status_counts = Counter(p.status.value for p in primitives)
+        by_status = {s: status_counts[s] for s in ("stable", "recent", "contested")}
 
         data = {
             "alphabet_index": {
@@ -107,86 +216,68 @@ class StateManager:
                     "by_domain": by_domain,
                     "by_status": by_status,
                 },
-                "primitives": [
-                    {
-                        "id": p.id,
-                        "label": p.label,
-                        "prime": p.prime,
-                        "domain": p.domain.value,
-                        "status": p.status.value,
-                        "added_iteration": p.added_iteration,
-                        "last_reviewed": p.last_reviewed,
-                        "confidence": p.confidence,
-                    }
-                    for p in primitives
-                ]
+                "primitives": _INDEX_ADAPTER.dump_python(primitives, mode="json"),
             }
         }
 
-        with open(index_file, "w") as f:
-            yaml.dump(data, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+        with open(index_file, "wb") as f:
+            yaml.dump(data, f, Dumper=_Dumper, default_flow_style=False, sort_keys=False, allow_unicode=True, encoding="utf-8")
+        self._index_cache = (self.index_version(), list(primitives))
+        self._labels_cache = None
 
     def load_primitive_detailed(self, primitive_id: str) -> Optional[PrimitiveDetailed]:
         """Load a detailed primitive entry."""
+        path = self._detailed_path(primitive_id)
+        if path is None:
+            return None
+        return self._read_detailed(path)
+
+    def load_all_primitives_detailed(self) -> dict[str, PrimitiveDetailed]:
+        """Load the detailed entry of every indexed primitive that has one, keyed by id."""
+        detailed = {}
+        for p in self.load_alphabet_index():
+            path = self._detailed_path(p.id)
+            if path is not None:
+                detailed[p.id] = self._read_detailed(path)
+        return detailed
+
+    def _read_detailed(self, path: Path) -> PrimitiveDetailed:
+        with open(path, "rb") as file:
+            data = yaml.load(file, Loader=_Loader)
+        return PrimitiveDetailed.model_validate(data["primitive"])
+
+    def _detailed_path(self, primitive_id: str) -> Optional[Path]:
+        """Find the detailed file for an id, scanning the directory only when it changes."""
         detailed_dir = self.alphabet_path / "primitives" / "detailed"
-        for f in detailed_dir.glob(f"{primitive_id}_*.yaml"):
-            with open(f) as file:
-                data = yaml.safe_load(file)
-            prim_data = data["primitive"]
-            # Parse definition
-            if isinstance(prim_data.get("definition"), dict):
-                prim_data["definition"] = Definition(**prim_data["definition"])
-            # Parse domain
-            if isinstance(prim_data.get("domain_primary"), str):
-                prim_data["domain_primary"] = Domain(prim_data["domain_primary"])
-            if prim_data.get("domains_secondary"):
-                prim_data["domains_secondary"] = [
-                    Domain(d) if isinstance(d, str) else d
-                    for d in prim_data["domains_secondary"]
-                ]
-            return PrimitiveDetailed(**prim_data)
-        return None
+        try:
+            version = detailed_dir.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+        if self._detailed_paths is None or self._detailed_paths[0] != version:
+            # Files are named {id}_{label}.yaml and ids may contain underscores,
+            # so index every prefix ending before an underscore
+            paths: dict[str, Path] = {}
+            for name in sorted(os.listdir(detailed_dir)):
+                if not name.endswith(".yaml"):
+                    continue
+                stem = name[:-len(".yaml")]
+                pos = stem.find("_")
+                while pos != -1:
+                    paths.setdefault(stem[:pos], detailed_dir / name)
+                    pos = stem.find("_", pos + 1)
+            self._detailed_paths = (version, paths)
+        return self._detailed_paths[1].get(primitive_id)
 
     def save_primitive_detailed(self, primitive: PrimitiveDetailed) -> Path:
         """Save a detailed primitive entry."""
         filename = f"{primitive.id}_{primitive.label}.yaml"
         filepath = self.alphabet_path / "primitives" / "detailed" / filename
 
-        data = {
-            "primitive": {
-                "id": primitive.id,
-                "symbol": primitive.symbol,
-                "label": primitive.label,
-                "definition": {
-                    "informal": primitive.definition.informal,
-                    "formal": primitive.definition.formal,
-                    "ostensive": primitive.definition.ostensive,
-                    "negative": primitive.definition.negative,
-                },
-                "domain_primary": primitive.domain_primary.value,
-                "domains_secondary": [d.value for d in primitive.domains_secondary],
-                "contrasts_with": [
-                    {"id": r.id, "label": r.label, "reason": r.reason}
-                    for r in primitive.contrasts_with
-                ],
-                "presupposes": [
-                    {"id": r.id, "label": r.label, "reason": r.reason}
-                    for r in primitive.presupposes
-                ],
-                "often_combined_with": [
-                    {"id": r.id, "label": r.label, "reason": r.reason}
-                    for r in primitive.often_combined_with
-                ],
-                "proposed_iteration": primitive.proposed_iteration,
-                "accepted_iteration": primitive.accepted_iteration,
-                "prime_number": primitive.prime_number,
-                "confidence": primitive.confidence,
-                "version": primitive.version,
-            }
-        }
+        data = {"primitive": primitive.model_dump(mode="json")}
 
-        with open(filepath, "w") as f:
-            yaml.dump(data, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+        with open(filepath, "wb") as f:
+            yaml.dump(data, f, Dumper=_Dumper, default_flow_style=False, sort_keys=False, allow_unicode=True, encoding="utf-8")
+        self._detailed_paths = None
 
         return filepath
 
@@ -195,8 +286,8 @@ class StateManager:
     def load_relationships(self) -> RelationshipGraph:
         """Load the relationship graph."""
         graph_file = self.alphabet_path / "relationships" / "graph.yaml"
-        with open(graph_file) as f:
-            data = yaml.safe_load(f)
+        with open(graph_file, "rb") as f:
+            data = yaml.load(f, Loader=_Loader)
         graph_data = data.get("relationship_graph", {})
         return RelationshipGraph(
             version=graph_data.get("version", "1.0.0"),
@@ -219,8 +310,35 @@ class StateManager:
                 "composes_well": graph.composes_well,
             }
         }
-        with open(graph_file, "w") as f:
-            yaml.dump(data, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+        self._write_yaml_if_changed(graph_file, data, data["relationship_graph"])
+
+    # === FILE WRITES ===
+
+    def _write_yaml_if_changed(self, path: Path, data: dict, payload: dict) -> None:
+        """
+        Atomically write data to path unless payload matches our last write.
+
+        payload is the section of data that carries content; its last_updated
+        key is ignored, so a save that would only bump the timestamp is
+        skipped. Files changed by anyone else since are always rewritten.
+        """
+        content = {k: v for k, v in payload.items() if k != "last_updated"}
+        digest = hashlib.blake2b(repr(content).encode(), digest_size=16).digest()
+        written = self._written_digests.get(path)
+        if written is not None and written[1] == digest:
+            try:
+                stat = path.stat()
+                if (stat.st_mtime_ns, stat.st_size) == written[0]:
+                    return
+            except FileNotFoundError:
+                pass
+
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        with open(tmp_path, "wb") as f:
+            yaml.dump(data, f, Dumper=_Dumper, default_flow_style=False, sort_keys=False, allow_unicode=True, encoding="utf-8")
+        os.replace(tmp_path, path)
+        stat = path.stat()
+        self._written_digests[path] = ((stat.st_mtime_ns, stat.st_size), digest)
 
     # === PRIMES ===
 
@@ -230,33 +348,24 @@ class StateManager:
         if not primitives:
             return 2  # First prime
 
-        used_primes = {p.prime for p in primitives}
-        candidate = max(used_primes) + 1
-
-        while not self._is_prime(candidate):
-            candidate += 1
-
-        return candidate
-
-    def _is_prime(self, n: int) -> bool:
-        """Check if n is prime."""
-        if n < 2:
-            return False
-        if n == 2:
-            return True
-        if n % 2 == 0:
-            return False
-        for i in range(3, int(n**0.5) + 1, 2):
-            if n % i == 0:
-                return False
-        return True
+        largest = max(p.prime for p in primitives)
+        limit = _SIEVE_START
+        while True:
+            primes = _primes_up_to(limit)
+            i = bisect.bisect_right(primes, largest)
+            if i < len(primes):
+                return primes[i]
+            limit *= 2
 
     # === ITERATION LOGS ===
 
     def ensure_iteration_log_dir(self, iteration: int) -> Path:
-        """Create iteration log directory if needed."""
-        log_dir = self.reasoning_path / "logs" / f"iteration_{iteration:03d}"
-        log_dir.mkdir(parents=True, exist_ok=True)
+        """Create iteration log directory if needed, once per iteration."""
+        log_dir = self._log_dirs.get(iteration)
+        if log_dir is None:
+            log_dir = self.reasoning_path / "logs" / f"iteration_{iteration:03d}"
+            log_dir.mkdir(parents=True, exist_ok=True)
+            self._log_dirs[iteration] = log_dir
         return log_dir
 
     def save_log(
@@ -269,10 +378,11 @@ class StateManager:
         log_dir = self.ensure_iteration_log_dir(iteration)
         filepath = log_dir / filename
 
-        with open(filepath, "w") as f:
-            if isinstance(content, dict):
-                yaml.dump(content, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
-            else:
+        if isinstance(content, dict):
+            with open(filepath, "wb") as f:
+                yaml.dump(content, f, Dumper=_Dumper, default_flow_style=False, sort_keys=False, allow_unicode=True, encoding="utf-8")
+        else:
+            with open(filepath, "w") as f:
                 f.write(content)
 
         return filepath
@@ -285,11 +395,11 @@ class StateManager:
         if not filepath.exists():
             return None
 
+        if filename.endswith(".yaml"):
+            with open(filepath, "rb") as f:
+                return yaml.load(f, Loader=_Loader)
         with open(filepath) as f:
-            if filename.endswith(".yaml"):
-                return yaml.safe_load(f)
-            else:
-                return f.read()
+            return f.read()
 
     # === HELPERS ===
 
@@ -316,6 +426,7 @@ class StateManager:
             total_proposed=history.get("total_proposed", 0),
             total_accepted=history.get("total_accepted", 0),
             total_rejected=history.get("total_rejected", 0),
+            recent_verdicts=history.get("recent_verdicts", []),
         )
 
     def _serialize_iteration_state(self, state: IterationState) -> dict:
@@ -351,11 +462,12 @@ class StateManager:
                 "total_proposed": state.total_proposed,
                 "total_accepted": state.total_accepted,
                 "total_rejected": state.total_rejected,
+                "recent_verdicts": state.recent_verdicts,
             },
         }
 
     def load_config(self) -> dict:
         """Load the main configuration file."""
         config_file = self.base_path / "config.yaml"
-        with open(config_file) as f:
-            return yaml.safe_load(f)
+        with open(config_file, "rb") as f:
+            return yaml.load(f, Loader=_Loader)
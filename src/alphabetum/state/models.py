@@ -116,6 +116,7 @@ class IterationState(BaseModel):
     coverage_score: float = 0.0
     consistency_score: float = 1.0
     recent_acceptance_rate: Optional[float] = None
+    recent_verdicts: list[bool] = Field(default_factory=list)  # accepted?, oldest first
 
     total_proposed: int = 0
     total_accepted: int = 0
@@ -1,22 +1,25 @@
 """Validation checks for the alphabet."""
 
+from collections import Counter, defaultdict, deque
 from dataclasses import dataclass, field
 from pathlib import Path
 from datetime import datetime
+from itertools import islice
 from typing import Optional
 import yaml
 
 try:
-    import networkx as nx
-    HAS_NETWORKX = True
+    from yaml import CSafeLoader as _Loader
 except ImportError:
-    HAS_NETWORKX = False
+    from yaml import SafeLoader as _Loader
 
 from ..state.manager import StateManager
 from ..state.models import PrimitiveIndexEntry, PrimitiveDetailed, Domain
 
+_ALL_DOMAIN_VALUES: tuple[str, ...] = tuple(d.value for d in Domain)
 
-@dataclass
+
+@dataclass(slots=True)
 class ValidationResult:
     """Result of a validation check."""
     passed: bool
@@ -25,7 +28,7 @@ class ValidationResult:
     recommendations: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class CoverageResult:
     """Result of coverage testing."""
     total: int
@@ -37,25 +40,106 @@ class CoverageResult:
     details: list[dict] = field(default_factory=list)
 
 
+def _primitive_ids(primitives: list[PrimitiveIndexEntry]) -> frozenset[str]:
+    """Ids of the given primitives, for reference checks."""
+    return frozenset(p.id for p in primitives)
+
+
+def _find_cycles(adjacency: dict[str, list[str]], first_only: bool = False) -> list[list[str]]:
+    """
+    Find one cycle per strongly connected component of a dependency graph.
+
+    Uses an iterative Tarjan SCC pass, so it is linear in the graph size and
+    safe on deep graphs. Each cycle lists its nodes in edge order without
+    repeating the first, e.g. ["a", "b"] for a -> b -> a. With first_only,
+    returns as soon as one cyclic component is closed.
+    """
+    index: dict[str, int] = {}
+    lowlink: dict[str, int] = {}
+    stack: list[str] = []
+    on_stack: set[str] = set()
+    cycles = []
+
+    for root in adjacency:
+        if root in index:
+            continue
+        index[root] = lowlink[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(adjacency[root]))]
+        while work:
+            node, successors = work[-1]
+            for succ in successors:
+                if succ not in index:
+                    index[succ] = lowlink[succ] = len(index)
+                    stack.append(succ)
+                    on_stack.add(succ)
+                    work.append((succ, iter(adjacency.get(succ, ()))))
+                    break
+                if succ in on_stack:
+                    lowlink[node] = min(lowlink[node], index[succ])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index[node]:
+                    component = set()
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.add(member)
+                        if member == node:
+                            break
+                    if len(component) > 1 or node in adjacency.get(node, ()):
+                        cycles.append(_shortest_cycle(node, adjacency, component))
+                        if first_only:
+                            return cycles
+
+    return cycles
+
+
+def _shortest_cycle(start: str, adjacency: dict[str, list[str]], component: set[str]) -> list[str]:
+    """Breadth-first search for the shortest cycle through start within its component."""
+    parents: dict[str, str] = {}
+    queue = deque([start])
+    while queue:
+        node = queue.popleft()
+        for succ in adjacency.get(node, ()):
+            if succ == start:
+                cycle = [node]
+                while cycle[-1] != start:
+                    cycle.append(parents[cycle[-1]])
+                return cycle[::-1]
+            if succ in component and succ not in parents:
+                parents[succ] = node
+                queue.append(succ)
+    return [start]  # unreachable for a strongly connected component
+
+
 class AlphabetValidator:
     """Main validation class for ALPHABETUM."""
 
     def __init__(self, base_path: Path):
         self.base_path = Path(base_path)
         self.state_manager = StateManager(base_path)
+        # Parsed benchmarks keyed on the benchmark file version
+        self._benchmarks_cache: Optional[tuple[tuple[int, int], list[dict]]] = None
 
     def run_full_validation(self) -> dict[str, ValidationResult]:
         """Run all validation checks."""
         primitives = self.state_manager.load_alphabet_index()
         relationships = self.state_manager.load_relationships()
+        detailed = self.state_manager.load_all_primitives_detailed()
+        primitive_ids = _primitive_ids(primitives)
 
         results = {}
 
         # Consistency checks
-        results["circularity"] = self.check_circularity(primitives)
+        results["circularity"] = self.check_circularity(primitives, detailed)
         results["redundancy"] = self.check_redundancy(primitives)
-        results["contrast"] = self.check_contrasts(primitives, relationships)
-        results["presupposition"] = self.check_presuppositions(primitives, relationships)
+        results["contrast"] = self.check_contrasts(primitives, relationships, primitive_ids)
+        results["presupposition"] = self.check_presuppositions(primitives, relationships, primitive_ids)
 
         # Coverage check
         coverage = self.check_coverage(primitives)
@@ -72,21 +156,22 @@ class AlphabetValidator:
         return results
 
     def run_quick_check(self) -> ValidationResult:
-        """Run quick consistency check."""
+        """Run quick consistency check, stopping at the first failing check."""
         primitives = self.state_manager.load_alphabet_index()
-        relationships = self.state_manager.load_relationships()
 
         issues = []
 
         # Quick circularity check
-        circ = self.check_circularity(primitives)
+        circ = self.check_circularity(primitives, first_only=True)
         if not circ.passed:
             issues.extend(circ.issues)
 
         # Quick presupposition check
-        presup = self.check_presuppositions(primitives, relationships)
-        if not presup.passed:
-            issues.extend(presup.issues)
+        if not issues:
+            relationships = self.state_manager.load_relationships()
+            presup = self.check_presuppositions(primitives, relationships, _primitive_ids(primitives))
+            if not presup.passed:
+                issues.extend(presup.issues)
 
         return ValidationResult(
             passed=len(issues) == 0,
@@ -94,39 +179,29 @@ class AlphabetValidator:
             issues=issues
         )
 
-    def check_circularity(self, primitives: list[PrimitiveIndexEntry]) -> ValidationResult:
-        """Check for circular definitions."""
+    def check_circularity(
+        self,
+        primitives: list[PrimitiveIndexEntry],
+        detailed: Optional[dict[str, PrimitiveDetailed]] = None,
+        first_only: bool = False
+    ) -> ValidationResult:
+        """Check for circular definitions, optionally stopping at the first cycle."""
         issues = []
-
-        if not HAS_NETWORKX:
-            # Simplified check without graph library
-            return ValidationResult(
-                passed=True,
-                score=1.0,
-                recommendations=["Install networkx for full circularity analysis"]
-            )
+        if detailed is None:
+            detailed = self.state_manager.load_all_primitives_detailed()
 
         # Build dependency graph from detailed entries
-        G = nx.DiGraph()
+        adjacency: dict[str, list[str]] = {}
         for p in primitives:
-            G.add_node(p.id)
-            detailed = self.state_manager.load_primitive_detailed(p.id)
-            if detailed:
-                for presup in detailed.presupposes:
-                    G.add_edge(p.id, presup.id)
-
-        # Find cycles
-        try:
-            cycles = list(nx.simple_cycles(G))
-            if cycles:
-                for cycle in cycles:
-                    issues.append({
-                        "type": "circular_dependency",
-                        "cycle": cycle,
-                        "severity": "critical"
-                    })
-        except Exception:
-            pass
+            entry = detailed.get(p.id)
+            adjacency[p.id] = [presup.id for presup in entry.presupposes] if entry else []
+
+        for cycle in _find_cycles(adjacency, first_only):
+            issues.append({
+                "type": "circular_dependency",
+                "cycle": cycle,
+                "severity": "critical"
+            })
 
         return ValidationResult(
             passed=len(issues) == 0,
@@ -140,12 +215,9 @@ class AlphabetValidator:
         issues = []
 
         # Group by domain - primitives in same domain might overlap
-        by_domain: dict[str, list] = {}
+        by_domain: defaultdict[str, list] = defaultdict(list)
         for p in primitives:
-            domain = p.domain.value
-            if domain not in by_domain:
-                by_domain[domain] = []
-            by_domain[domain].append(p)
+            by_domain[p.domain.value].append(p)
 
         # Check for potential redundancies (simplified)
         for domain, prims in by_domain.items():
@@ -168,14 +240,18 @@ class AlphabetValidator:
     def check_contrasts(
         self,
         primitives: list[PrimitiveIndexEntry],
-        relationships
+        relationships,
+        primitive_ids: Optional[frozenset[str]] = None
     ) -> ValidationResult:
-        """Check contrast consistency."""
+        """Check contrast consistency, reusing primitive_ids when the caller already has them."""
         issues = []
-        primitive_ids = {p.id for p in primitives}
+        if primitive_ids is None:
+            primitive_ids = _primitive_ids(primitives)
 
         for contrast in relationships.contrasts:
             if isinstance(contrast, (list, tuple)) and len(contrast) == 2:
+                if primitive_ids.issuperset(contrast):
+                    continue
                 p1, p2 = contrast
                 if p1 not in primitive_ids:
                     issues.append({
@@ -200,11 +276,13 @@ class AlphabetValidator:
     def check_presuppositions(
         self,
         primitives: list[PrimitiveIndexEntry],
-        relationships
+        relationships,
+        primitive_ids: Optional[frozenset[str]] = None
     ) -> ValidationResult:
-        """Check presupposition validity."""
+        """Check presupposition validity, reusing primitive_ids when the caller already has them."""
         issues = []
-        primitive_ids = {p.id for p in primitives}
+        if primitive_ids is None:
+            primitive_ids = _primitive_ids(primitives)
 
         for presup in relationships.presupposes:
             target = presup.get("target")
@@ -230,18 +308,18 @@ class AlphabetValidator:
     def check_coverage(self, primitives: list[PrimitiveIndexEntry]) -> CoverageResult:
         """Check coverage against benchmarks."""
         benchmarks = self._load_benchmarks()
-        primitive_labels = {p.label for p in primitives}
+        primitive_labels = frozenset(p.label for p in primitives)
 
         expressible = 0
         partial = 0
         inexpressible = 0
-        gaps = []
+        gap_counts: Counter = Counter()
         details = []
 
         for benchmark in benchmarks:
             hints = benchmark.get("decomposition_hints", [])
-            matched = [h for h in hints if h in primitive_labels]
-            coverage = len(matched) / len(hints) if hints else 0
+            missing = [h for h in hints if h not in primitive_labels]
+            coverage = (len(hints) - len(missing)) / len(hints) if hints else 0
 
             if coverage >= 0.7:
                 status = "expressible"
@@ -249,35 +327,25 @@ class AlphabetValidator:
             elif coverage >= 0.3:
                 status = "partial"
                 partial += 1
-                missing = [h for h in hints if h not in primitive_labels]
-                gaps.extend(missing)
+                gap_counts.update(missing)
             else:
                 status = "inexpressible"
                 inexpressible += 1
-                missing = [h for h in hints if h not in primitive_labels]
-                gaps.extend(missing)
+                gap_counts.update(missing)
 
             details.append({
                 "concept": benchmark["name"],
                 "domain": benchmark.get("domain", "unknown"),
                 "status": status,
                 "coverage_ratio": coverage,
-                "missing": [h for h in hints if h not in primitive_labels]
+                "missing": missing
             })
 
         total = len(benchmarks)
         coverage_score = expressible / total if total > 0 else 0
 
-        # Count gap frequencies
-        gap_counts: dict[str, int] = {}
-        for g in gaps:
-            gap_counts[g] = gap_counts.get(g, 0) + 1
-
-        sorted_gaps = sorted(
-            [{"label": k, "count": v} for k, v in gap_counts.items()],
-            key=lambda x: x["count"],
-            reverse=True
-        )
+        # Top 20 gaps; ties keep first-seen order, as the old stable sort did
+        top_gaps = [{"label": k, "count": v} for k, v in gap_counts.most_common(20)]
 
         return CoverageResult(
             total=total,
@@ -285,7 +353,7 @@ class AlphabetValidator:
             partial=partial,
             inexpressible=inexpressible,
             coverage_score=coverage_score,
-            gaps=sorted_gaps[:20],  # Top 20 gaps
+            gaps=top_gaps,
             details=details
         )
 
@@ -294,14 +362,10 @@ class AlphabetValidator:
         issues = []
 
         # Count primitives per domain
-        by_domain: dict[str, int] = {}
-        for p in primitives:
-            domain = p.domain.value
-            by_domain[domain] = by_domain.get(domain, 0) + 1
+        by_domain = Counter(p.domain.value for p in primitives)
 
         # Check for neglected domains
-        all_domains = [d.value for d in Domain]
-        for domain in all_domains:
+        for domain in _ALL_DOMAIN_VALUES:
             count = by_domain.get(domain, 0)
             if count == 0:
                 issues.append({
@@ -320,9 +384,9 @@ class AlphabetValidator:
 
         # Calculate balance score
         if by_domain:
-            values = list(by_domain.values())
+            values = by_domain.values()
             max_count = max(values)
-            min_count = min(values) if values else 0
+            min_count = min(values)
             balance = min_count / max_count if max_count > 0 else 1.0
         else:
             balance = 0.0
@@ -342,13 +406,20 @@ class AlphabetValidator:
         return self.check_coverage(primitives)
 
     def _load_benchmarks(self) -> list[dict]:
-        """Load benchmark concepts."""
+        """Load benchmark concepts, reparsing only when the file changes."""
         benchmarks_file = self.base_path / "validation" / "benchmarks" / "test_concepts.yaml"
         if not benchmarks_file.exists():
             return []
-        with open(benchmarks_file) as f:
-            data = yaml.safe_load(f)
-        return data.get("benchmark_concepts", [])
+        stat = benchmarks_file.stat()
+        version = (stat.st_mtime_ns, stat.st_size)
+        if self._benchmarks_cache is not None and self._benchmarks_cache[0] == version:
+            return self._benchmarks_cache[1]
+
+        with open(benchmarks_file, "rb") as f:
+            data = yaml.load(f, Loader=_Loader)
+        benchmarks = data.get("benchmark_concepts", [])
+        self._benchmarks_cache = (version, benchmarks)
+        return benchmarks
 
     def _coverage_recommendations(self, coverage: CoverageResult) -> list[str]:
         """Generate recommendations based on coverage results."""
@@ -366,23 +437,28 @@ class AlphabetValidator:
         iteration: int
     ) -> tuple[dict, str]:
         """Generate validation report in YAML and Markdown."""
-        overall_score = sum(r.score for r in results.values()) / len(results) if results else 0
+        total_score = 0.0
+        all_passed = True
+        checks = {}
+        for name, result in results.items():
+            total_score += result.score
+            all_passed = all_passed and result.passed
+            checks[name] = {
+                "passed": result.passed,
+                "score": round(result.score, 3),
+                "issues_count": len(result.issues),
+            }
+        overall_score = total_score / len(results) if results else 0
+        generated = datetime.utcnow().isoformat() + "Z"
 
         # YAML report
         yaml_report = {
             "validation_report": {
-                "timestamp": datetime.utcnow().isoformat() + "Z",
+                "timestamp": generated,
                 "iteration": iteration,
-                "overall_passed": all(r.passed for r in results.values()),
+                "overall_passed": all_passed,
                 "overall_score": round(overall_score, 3),
-                "checks": {
-                    name: {
-                        "passed": result.passed,
-                        "score": round(result.score, 3),
-                        "issues_count": len(result.issues),
-                    }
-                    for name, result in results.items()
-                }
+                "checks": checks,
             }
         }
 
@@ -390,9 +466,9 @@ class AlphabetValidator:
         md_lines = [
             f"# Validation Report: Iteration {iteration}",
             "",
-            f"**Generated:** {datetime.utcnow().isoformat()}Z",
+            f"**Generated:** {generated}",
             f"**Overall Score:** {overall_score:.2f} / 1.00",
-            f"**Status:** {'PASS' if all(r.passed for r in results.values()) else 'ISSUES FOUND'}",
+            f"**Status:** {'PASS' if all_passed else 'ISSUES FOUND'}",
             "",
             "## Summary",
             "",
@@ -400,9 +476,10 @@ class AlphabetValidator:
             "|-------|--------|-------|",
         ]
 
-        for name, result in results.items():
-            status = "Pass" if result.passed else "Fail"
-            md_lines.append(f"| {name.title()} | {status} | {result.score:.2f} |")
+        md_lines.extend(
+            f"| {name.title()} | {'Pass' if result.passed else 'Fail'} | {result.score:.2f} |"
+            for name, result in results.items()
+        )
 
         md_lines.extend(["", "## Details", ""])
 
@@ -413,13 +490,11 @@ class AlphabetValidator:
 
             if result.issues:
                 md_lines.append("\nIssues:")
-                for issue in result.issues[:5]:
-                    md_lines.append(f"- {issue}")
+                md_lines.extend(f"- {issue}" for issue in islice(result.issues, 5))
 
             if result.recommendations:
                 md_lines.append("\nRecommendations:")
-                for rec in result.recommendations:
-                    md_lines.append(f"- {rec}")
+                md_lines.extend(f"- {rec}" for rec in result.recommendations)
 
             md_lines.append("")
 
@@ -9,11 +9,15 @@ Creates publication-ready figures for:
 - Network graphs
 """
 
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
 from typing import Optional
 from datetime import datetime
 
 try:
+    import numpy as np
     import matplotlib.pyplot as plt
     import matplotlib.patches as mpatches
     from matplotlib.ticker import MaxNLocator
@@ -23,7 +27,7 @@ except ImportError:
 
 from ..analytics.history import HistoryTracker, IterationSnapshot
 from ..analytics.metrics import MetricsCalculator
-from ..analytics.convergence import ConvergenceAnalyzer
+from ..analytics.convergence import ConvergenceAnalyzer, ConvergenceReport
 
 
 # Color palette for consistent styling
@@ -53,6 +57,57 @@ COLORS = {
     "language": "#9B2226",
 }
 
+# Snapshot fields plotted as time series, with their array dtypes
+SERIES_FIELDS = {
+    "iteration": "int64",
+    "total_primitives": "int64",
+    "primitives_added": "int64",
+    "acceptance_rate": "float64",
+    "cumulative_acceptance_rate": "float64",
+    "coverage_score": "float64",
+    "coverage_delta": "float64",
+    "avg_confidence": "float64",
+    "consistency_score": "float64",
+}
+
+
+def _rolling_mean_std(values, window: int) -> tuple:
+    """
+    Trailing-window mean and population std of a 1-D series.
+
+    Windows are truncated at the start of the series, so element i covers
+    values[max(0, i - window + 1):i + 1]. Computed from cumulative sums in
+    O(n) rather than re-summing every window.
+    """
+    x = np.asarray(values, dtype=float)
+    sums = np.concatenate(([0.0], np.cumsum(x)))
+    squares = np.concatenate(([0.0], np.cumsum(x * x)))
+    end = np.arange(1, len(x) + 1)
+    start = np.maximum(0, end - window)
+    n = end - start
+    mean = (sums[end] - sums[start]) / n
+    var = (squares[end] - squares[start]) / n - mean * mean
+    return mean, np.sqrt(np.maximum(var, 0.0))
+
+
+_STYLE_APPLIED = False
+
+
+def _apply_style_once() -> None:
+    """Apply the plot style to the global rcParams on first use."""
+    global _STYLE_APPLIED
+    if _STYLE_APPLIED:
+        return
+    plt.style.use('seaborn-v0_8-whitegrid')
+    plt.rcParams.update({
+        'figure.figsize': (10, 6),
+        'figure.dpi': 150,
+        'font.size': 11,
+        'axes.titlesize': 14,
+        'axes.labelsize': 12,
+    })
+    _STYLE_APPLIED = True
+
 
 class AlphabetumPlotter:
     """
@@ -64,21 +119,63 @@ class AlphabetumPlotter:
     - High resolution export
     """
 
-    def __init__(self, history: HistoryTracker, output_dir: Optional[Path] = None):
+    def __init__(
+        self,
+        history: HistoryTracker,
+        output_dir: Optional[Path] = None,
+        export_dpi: Optional[int] = None,
+    ):
         if not HAS_MATPLOTLIB:
             raise ImportError("matplotlib is required for visualization. Install with: pip install matplotlib")
 
         self.history = history
         self.output_dir = output_dir or Path("reports/figures")
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._snapshots: Optional[list[IterationSnapshot]] = None
+        self._arr_cache: Optional[tuple[int, dict]] = None
+        # 150 matches the on-screen figure.dpi; use 300 for editorial export
+        self.export_dpi = export_dpi or int(os.environ.get("ALPHABETUM_DPI", 150))
+
+        _apply_style_once()
+
+    def _snaps(self) -> list[IterationSnapshot]:
+        """
+        Get the history snapshots, copied once per plotter.
+
+        A plotter renders one report's worth of figures, so later history
+        appends are picked up by creating a new plotter.
+        """
+        if self._snapshots is None:
+            self._snapshots = self.history.get_snapshots()
+        return self._snapshots
+
+    def _arrays(self, snapshots: list[IterationSnapshot]) -> dict:
+        """
+        Get snapshot fields as numpy columns, one per SERIES_FIELDS entry.
+
+        History is append-only, so the columns are rebuilt only when the
+        number of snapshots changes.
+        """
+        if self._arr_cache is None or self._arr_cache[0] != len(snapshots):
+            columns = {
+                name: np.fromiter((getattr(s, name) for s in snapshots), dtype=dtype, count=len(snapshots))
+                for name, dtype in SERIES_FIELDS.items()
+            }
+            self._arr_cache = (len(snapshots), columns)
+        return self._arr_cache[1]
+
+    def _save(self, filename: str, tight_bbox: bool = False) -> Path:
+        """
+        Save and close the current figure.
 
-        # Set style
-        plt.style.use('seaborn-v0_8-whitegrid')
-        plt.rcParams['figure.figsize'] = (10, 6)
-        plt.rcParams['figure.dpi'] = 150
-        plt.rcParams['font.size'] = 11
-        plt.rcParams['axes.titlesize'] = 14
-        plt.rcParams['axes.labelsize'] = 12
+        Figures are laid out with tight_layout() before saving; tight_bbox
+        is only needed when artists sit outside the figure (external legends,
+        raised suptitles) and costs an extra draw pass.
+        """
+        filepath = self.output_dir / filename
+        plt.savefig(filepath, dpi=self.export_dpi, bbox_inches='tight' if tight_bbox else None)
+        plt.close()
+        return filepath
 
     def plot_growth_curve(self, save: bool = True, show: bool = False) -> Optional[Path]:
         """
@@ -86,15 +183,16 @@ class AlphabetumPlotter:
 
         Shows total primitives with acceptance rate overlay.
         """
-        snapshots = self.history.get_snapshots()
+        snapshots = self._snaps()
         if not snapshots:
             return None
 
         fig, ax1 = plt.subplots(figsize=(12, 6))
 
-        iterations = [s.iteration for s in snapshots]
-        totals = [s.total_primitives for s in snapshots]
-        acceptance_rates = [s.cumulative_acceptance_rate * 100 for s in snapshots]
+        arrays = self._arrays(snapshots)
+        iterations = arrays["iteration"]
+        totals = arrays["total_primitives"]
+        acceptance_rates = arrays["cumulative_acceptance_rate"] * 100
 
         # Primary axis: Total primitives
         color1 = COLORS["primary"]
@@ -126,10 +224,7 @@ class AlphabetumPlotter:
         plt.tight_layout()
 
         if save:
-            filepath = self.output_dir / "growth_curve.png"
-            plt.savefig(filepath, dpi=300, bbox_inches='tight')
-            plt.close()
-            return filepath
+            return self._save("growth_curve.png")
 
         if show:
             plt.show()
@@ -142,33 +237,22 @@ class AlphabetumPlotter:
 
         Shows coverage score with target threshold line and confidence band.
         """
-        snapshots = self.history.get_snapshots()
+        snapshots = self._snaps()
         if not snapshots:
             return None
 
         fig, ax = plt.subplots(figsize=(12, 6))
 
-        iterations = [s.iteration for s in snapshots]
-        coverage = [s.coverage_score * 100 for s in snapshots]
+        arrays = self._arrays(snapshots)
+        iterations = arrays["iteration"]
+        coverage = arrays["coverage_score"] * 100
 
         # Calculate rolling average and confidence band
-        window = 3
-        rolling_avg = []
-        rolling_std = []
-        for i in range(len(coverage)):
-            start = max(0, i - window + 1)
-            window_data = coverage[start:i+1]
-            rolling_avg.append(sum(window_data) / len(window_data))
-            if len(window_data) > 1:
-                mean = rolling_avg[-1]
-                var = sum((x - mean) ** 2 for x in window_data) / len(window_data)
-                rolling_std.append(var ** 0.5)
-            else:
-                rolling_std.append(0)
+        rolling_avg, rolling_std = _rolling_mean_std(coverage, window=3)
 
         # Plot confidence band
-        upper = [a + s for a, s in zip(rolling_avg, rolling_std)]
-        lower = [a - s for a, s in zip(rolling_avg, rolling_std)]
+        upper = rolling_avg + rolling_std
+        lower = rolling_avg - rolling_std
         ax.fill_between(iterations, lower, upper, alpha=0.2, color=COLORS["primary"])
 
         # Plot actual coverage
@@ -198,10 +282,7 @@ class AlphabetumPlotter:
         plt.tight_layout()
 
         if save:
-            filepath = self.output_dir / "convergence.png"
-            plt.savefig(filepath, dpi=300, bbox_inches='tight')
-            plt.close()
-            return filepath
+            return self._save("convergence.png")
 
         if show:
             plt.show()
@@ -214,27 +295,27 @@ class AlphabetumPlotter:
 
         Shows how primitives accumulate across domains over time.
         """
-        snapshots = self.history.get_snapshots()
+        snapshots = self._snaps()
         if not snapshots:
             return None
 
         fig, ax = plt.subplots(figsize=(14, 7))
 
-        iterations = [s.iteration for s in snapshots]
+        iterations = self._arrays(snapshots)["iteration"]
 
         # Collect all domains
-        all_domains = set()
-        for s in snapshots:
-            all_domains.update(s.domain_counts.keys())
-        domains = sorted(all_domains)
+        domains = sorted(set().union(*(s.domain_counts for s in snapshots)))
 
-        # Build data matrix
-        data = {d: [s.domain_counts.get(d, 0) for s in snapshots] for d in domains}
+        # Build data matrix, one row per domain
+        row = {d: i for i, d in enumerate(domains)}
+        counts = np.zeros((len(domains), len(snapshots)), dtype=np.int64)
+        for j, s in enumerate(snapshots):
+            for d, c in s.domain_counts.items():
+                counts[row[d], j] = c
 
         # Stack the areas
         colors = [COLORS.get(d, COLORS["neutral"]) for d in domains]
-        ax.stackplot(iterations, *[data[d] for d in domains],
-                    labels=domains, colors=colors, alpha=0.8)
+        ax.stackplot(iterations, counts, labels=domains, colors=colors, alpha=0.8)
 
         ax.set_xlabel('Iteration')
         ax.set_ylabel('Number of Primitives')
@@ -247,10 +328,7 @@ class AlphabetumPlotter:
         plt.tight_layout()
 
         if save:
-            filepath = self.output_dir / "domain_evolution.png"
-            plt.savefig(filepath, dpi=300, bbox_inches='tight')
-            plt.close()
-            return filepath
+            return self._save("domain_evolution.png", tight_bbox=True)
 
         if show:
             plt.show()
@@ -261,7 +339,7 @@ class AlphabetumPlotter:
         """
         Plot current domain balance as horizontal bar chart.
         """
-        snapshots = self.history.get_snapshots()
+        snapshots = self._snaps()
         if not snapshots:
             return None
 
@@ -290,10 +368,7 @@ class AlphabetumPlotter:
         plt.tight_layout()
 
         if save:
-            filepath = self.output_dir / "domain_balance.png"
-            plt.savefig(filepath, dpi=300, bbox_inches='tight')
-            plt.close()
-            return filepath
+            return self._save("domain_balance.png")
 
         if show:
             plt.show()
@@ -304,21 +379,19 @@ class AlphabetumPlotter:
         """
         Plot acceptance rate trend with rolling average.
         """
-        snapshots = self.history.get_snapshots()
+        snapshots = self._snaps()
         if len(snapshots) < 2:
             return None
 
         fig, ax = plt.subplots(figsize=(12, 6))
 
-        iterations = [s.iteration for s in snapshots]
-        rates = [s.acceptance_rate * 100 for s in snapshots]
+        arrays = self._arrays(snapshots)
+        iterations = arrays["iteration"]
+        rates = arrays["acceptance_rate"] * 100
 
         # Rolling average
         window = min(5, len(rates))
-        rolling = []
-        for i in range(len(rates)):
-            start = max(0, i - window + 1)
-            rolling.append(sum(rates[start:i+1]) / (i - start + 1))
+        rolling, _ = _rolling_mean_std(rates, window)
 
         # Plot raw and rolling
         ax.bar(iterations, rates, alpha=0.3, color=COLORS["primary"], label='Per-Iteration')
@@ -335,10 +408,7 @@ class AlphabetumPlotter:
         plt.tight_layout()
 
         if save:
-            filepath = self.output_dir / "acceptance_trend.png"
-            plt.savefig(filepath, dpi=300, bbox_inches='tight')
-            plt.close()
-            return filepath
+            return self._save("acceptance_trend.png")
 
         if show:
             plt.show()
@@ -349,19 +419,20 @@ class AlphabetumPlotter:
         """
         Plot multi-metric dashboard showing velocity indicators.
         """
-        snapshots = self.history.get_snapshots()
+        snapshots = self._snaps()
         if len(snapshots) < 3:
             return None
 
         fig, axes = plt.subplots(2, 2, figsize=(14, 10))
 
-        iterations = [s.iteration for s in snapshots]
+        arrays = self._arrays(snapshots)
+        iterations = arrays["iteration"]
 
         # 1. Growth velocity (primitives added per iteration)
         ax1 = axes[0, 0]
-        added = [s.primitives_added for s in snapshots]
+        added = arrays["primitives_added"]
         ax1.bar(iterations, added, color=COLORS["primary"], alpha=0.7)
-        ax1.axhline(y=sum(added)/len(added), color=COLORS["danger"], linestyle='--', label='Average')
+        ax1.axhline(y=added.mean(), color=COLORS["danger"], linestyle='--', label='Average')
         ax1.set_title('Growth Velocity', fontweight='bold')
         ax1.set_xlabel('Iteration')
         ax1.set_ylabel('Primitives Added')
@@ -369,8 +440,8 @@ class AlphabetumPlotter:
 
         # 2. Coverage velocity (delta per iteration)
         ax2 = axes[0, 1]
-        deltas = [s.coverage_delta * 100 for s in snapshots]
-        colors = [COLORS["success"] if d > 0 else COLORS["danger"] for d in deltas]
+        deltas = arrays["coverage_delta"] * 100
+        colors = np.where(deltas > 0, COLORS["success"], COLORS["danger"])
         ax2.bar(iterations, deltas, color=colors, alpha=0.7)
         ax2.axhline(y=0, color='black', linewidth=0.5)
         ax2.set_title('Coverage Velocity', fontweight='bold')
@@ -379,8 +450,8 @@ class AlphabetumPlotter:
 
         # 3. Cumulative metrics
         ax3 = axes[1, 0]
-        totals = [s.total_primitives for s in snapshots]
-        coverage = [s.coverage_score * 100 for s in snapshots]
+        totals = arrays["total_primitives"]
+        coverage = arrays["coverage_score"] * 100
         ax3.plot(iterations, totals, color=COLORS["primary"], linewidth=2, label='Primitives')
         ax3_twin = ax3.twinx()
         ax3_twin.plot(iterations, coverage, color=COLORS["secondary"], linewidth=2, linestyle='--', label='Coverage %')
@@ -393,8 +464,8 @@ class AlphabetumPlotter:
 
         # 4. Quality metrics
         ax4 = axes[1, 1]
-        confidence = [s.avg_confidence for s in snapshots]
-        consistency = [s.consistency_score for s in snapshots]
+        confidence = arrays["avg_confidence"]
+        consistency = arrays["consistency_score"]
         ax4.plot(iterations, confidence, color=COLORS["primary"], linewidth=2, marker='o', label='Avg Confidence')
         ax4.plot(iterations, consistency, color=COLORS["success"], linewidth=2, marker='s', label='Consistency')
         ax4.set_title('Quality Metrics', fontweight='bold')
@@ -407,22 +478,28 @@ class AlphabetumPlotter:
         plt.tight_layout()
 
         if save:
-            filepath = self.output_dir / "velocity_dashboard.png"
-            plt.savefig(filepath, dpi=300, bbox_inches='tight')
-            plt.close()
-            return filepath
+            return self._save("velocity_dashboard.png", tight_bbox=True)
 
         if show:
             plt.show()
 
         return None
 
-    def plot_convergence_indicators(self, config: dict, save: bool = True, show: bool = False) -> Optional[Path]:
+    def plot_convergence_indicators(
+        self,
+        config: dict,
+        report: Optional[ConvergenceReport] = None,
+        save: bool = True,
+        show: bool = False,
+    ) -> Optional[Path]:
         """
         Plot convergence indicator summary.
+
+        Pass a report already computed for this history to skip re-running
+        the convergence analysis.
         """
-        analyzer = ConvergenceAnalyzer(self.history, config)
-        report = analyzer.analyze()
+        if report is None:
+            report = ConvergenceAnalyzer(self.history, config).analyze()
 
         if report.overall_status == "insufficient_data":
             return None
@@ -470,47 +547,56 @@ class AlphabetumPlotter:
         plt.tight_layout()
 
         if save:
-            filepath = self.output_dir / "convergence_indicators.png"
-            plt.savefig(filepath, dpi=300, bbox_inches='tight')
-            plt.close()
-            return filepath
+            return self._save("convergence_indicators.png")
 
         if show:
             plt.show()
 
         return None
 
-    def generate_all(self, config: Optional[dict] = None) -> list[Path]:
-        """Generate all available plots."""
-        plots = []
-
-        growth = self.plot_growth_curve()
-        if growth:
-            plots.append(growth)
-
-        convergence = self.plot_convergence()
-        if convergence:
-            plots.append(convergence)
-
-        domain_evo = self.plot_domain_evolution()
-        if domain_evo:
-            plots.append(domain_evo)
-
-        domain_bal = self.plot_domain_balance()
-        if domain_bal:
-            plots.append(domain_bal)
-
-        acceptance = self.plot_acceptance_trend()
-        if acceptance:
-            plots.append(acceptance)
-
-        velocity = self.plot_velocity_dashboard()
-        if velocity:
-            plots.append(velocity)
+    def generate_all(
+        self,
+        config: Optional[dict] = None,
+        workers: int = 1,
+        conv_report: Optional[ConvergenceReport] = None,
+    ) -> list[Path]:
+        """
+        Generate all available plots.
 
+        The figures are independent, so with workers > 1 they are rendered
+        in a process pool (pyplot is not thread-safe). Worker start-up costs
+        roughly one matplotlib import each, so this only pays off with
+        several free cores.
+        """
+        tasks = [
+            ("plot_growth_curve", {}),
+            ("plot_convergence", {}),
+            ("plot_domain_evolution", {}),
+            ("plot_domain_balance", {}),
+            ("plot_acceptance_trend", {}),
+            ("plot_velocity_dashboard", {}),
+        ]
         if config:
-            conv_ind = self.plot_convergence_indicators(config)
-            if conv_ind:
-                plots.append(conv_ind)
-
-        return plots
+            tasks.append(("plot_convergence_indicators", {"config": config, "report": conv_report}))
+
+        if workers > 1:
+            methods, kwargs = zip(*tasks)
+            with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as executor:
+                paths = list(executor.map(
+                    _render_one,
+                    repeat(self.history), repeat(self.output_dir), repeat(self.export_dpi),
+                    methods, kwargs,
+                ))
+        else:
+            paths = [getattr(self, method)(**kw) for method, kw in tasks]
+
+        return [path for path in paths if path]
+
+
+def _render_one(
+    history: HistoryTracker, output_dir: Path, export_dpi: int, method: str, kwargs: dict
+) -> Optional[Path]:
+    """Render a single figure in a pool worker."""
+    plt.switch_backend("Agg")
+    plotter = AlphabetumPlotter(history, output_dir, export_dpi)
+    return getattr(plotter, method)(**kwargs)
@@ -5,12 +5,20 @@ Creates comprehensive reports combining metrics, analysis, and visualizations
 suitable for editorial and research purposes.
 """
 
+import io
+from collections import Counter
+from heapq import nlargest
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
 import yaml
 import json
 
+try:
+    from yaml import CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeDumper as _Dumper
+
 from ..analytics.history import HistoryTracker
 from ..analytics.metrics import MetricsCalculator
 from ..analytics.convergence import ConvergenceAnalyzer
@@ -49,16 +57,18 @@ class ReportGenerator:
         metrics = metrics_calc.calculate_all()
         conv_report = convergence.analyze()
 
+        now = datetime.utcnow()
+
         # Generate report content
-        report = self._build_report(metrics, conv_report)
+        report = self._build_report(metrics, conv_report, now)
 
         # Save as multiple formats
-        timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
 
         # YAML (structured data)
         yaml_path = self.output_dir / f"evolution_report_{timestamp}.yaml"
         with open(yaml_path, "w") as f:
-            yaml.dump(report, f, default_flow_style=False, sort_keys=False)
+            yaml.dump(report, f, Dumper=_Dumper, default_flow_style=False, sort_keys=False)
 
         # Markdown (narrative)
         md_path = self.output_dir / f"evolution_report_{timestamp}.md"
@@ -69,13 +79,13 @@ class ReportGenerator:
         # JSON (for web/interactive use)
         json_path = self.output_dir / f"evolution_report_{timestamp}.json"
         with open(json_path, "w") as f:
-            json.dump(report, f, indent=2)
+            f.write(json.dumps(report, indent=2))
 
         # Generate figures
         try:
             from .plots import AlphabetumPlotter
             plotter = AlphabetumPlotter(self.history, self.output_dir / "figures")
-            figures = plotter.generate_all(self.config)
+            figures = plotter.generate_all(self.config, conv_report=conv_report)
             report["figures"] = [str(f) for f in figures]
         except ImportError:
             report["figures"] = []
@@ -83,7 +93,7 @@ class ReportGenerator:
 
         return md_path
 
-    def _build_report(self, metrics, conv_report) -> dict:
+    def _build_report(self, metrics, conv_report, generated_at: datetime) -> dict:
         """Build the report data structure."""
         state = self.state_manager.load_iteration_state()
         primitives = self.state_manager.load_alphabet_index()
@@ -91,7 +101,7 @@ class ReportGenerator:
 
         return {
             "report_metadata": {
-                "generated_at": datetime.utcnow().isoformat() + "Z",
+                "generated_at": generated_at.isoformat() + "Z",
                 "report_type": "evolution_analysis",
                 "version": "1.0.0",
             },
@@ -114,154 +124,125 @@ class ReportGenerator:
                 "by_domain": self._count_by_domain(primitives),
                 "recent": [
                     {"id": p.id, "label": p.label, "domain": p.domain.value}
-                    for p in sorted(primitives, key=lambda x: x.added_iteration, reverse=True)[:5]
+                    for p in nlargest(5, primitives, key=lambda x: x.added_iteration)
                 ],
             },
         }
 
     def _count_by_domain(self, primitives) -> dict:
         """Count primitives by domain."""
-        counts = {}
-        for p in primitives:
-            domain = p.domain.value
-            counts[domain] = counts.get(domain, 0) + 1
-        return counts
+        return dict(Counter(p.domain.value for p in primitives))
 
     def _generate_markdown(self, report: dict, metrics, conv_report) -> str:
         """Generate Markdown narrative report."""
-        lines = [
-            "# ALPHABETUM Evolution Report",
-            "",
-            f"**Generated:** {report['report_metadata']['generated_at']}",
-            "",
-            "---",
-            "",
-            "## Executive Summary",
-            "",
-        ]
+        buf = io.StringIO()
+        w = buf.write
 
         summary = report["summary"]
-        lines.extend([
-            f"After **{summary['current_iteration']} iterations**, the alphabet contains "
-            f"**{summary['total_primitives']} primitives** with a coverage score of "
-            f"**{summary['coverage_score']:.1%}**.",
-            "",
-            f"**Overall Status:** {summary['overall_status'].upper()}",
-            f"**Health Score:** {summary['health_score']:.0%}",
-            "",
-            "---",
-            "",
-            "## Growth Analysis",
-            "",
-        ])
+        w(f"""# ALPHABETUM Evolution Report
+
+**Generated:** {report['report_metadata']['generated_at']}
+
+---
+
+## Executive Summary
+
+After **{summary['current_iteration']} iterations**, the alphabet contains \
+**{summary['total_primitives']} primitives** with a coverage score of \
+**{summary['coverage_score']:.1%}**.
+
+**Overall Status:** {summary['overall_status'].upper()}
+**Health Score:** {summary['health_score']:.0%}
+
+---
+
+## Growth Analysis
+
+""")
 
         if metrics:
             g = metrics.growth
-            lines.extend([
-                f"- **Total Primitives:** {g.total_primitives}",
-                f"- **Growth Rate:** {g.growth_rate:.2f} primitives/iteration",
-                f"- **Velocity Trend:** {g.velocity_trend}",
-            ])
+            w(f"""- **Total Primitives:** {g.total_primitives}
+- **Growth Rate:** {g.growth_rate:.2f} primitives/iteration
+- **Velocity Trend:** {g.velocity_trend}
+""")
             if g.doubling_time:
-                lines.append(f"- **Doubling Time:** ~{g.doubling_time:.0f} iterations at current rate")
-            lines.append("")
+                w(f"- **Doubling Time:** ~{g.doubling_time:.0f} iterations at current rate\n")
+            w("\n")
 
-        # Efficiency
-        if metrics:
+            # Efficiency
             e = metrics.efficiency
-            lines.extend([
-                "## Efficiency Metrics",
-                "",
-                f"- **Acceptance Rate:** {e.acceptance_rate:.1%} ({e.acceptance_trend})",
-                f"- **Productivity:** {e.productivity:.2f} accepted/iteration",
-                f"- **Waste Ratio:** {e.waste_ratio:.1%}",
-                "",
-            ])
+            w(f"""## Efficiency Metrics
 
-        # Convergence
-        lines.extend([
-            "## Convergence Analysis",
-            "",
-        ])
+- **Acceptance Rate:** {e.acceptance_rate:.1%} ({e.acceptance_trend})
+- **Productivity:** {e.productivity:.2f} accepted/iteration
+- **Waste Ratio:** {e.waste_ratio:.1%}
 
+""")
+
+        # Convergence
         c = conv_report
-        lines.extend([
-            f"**Status:** {c.overall_status.upper()} (confidence: {c.overall_confidence:.0%})",
-            "",
-        ])
+        w(f"""## Convergence Analysis
+
+**Status:** {c.overall_status.upper()} (confidence: {c.overall_confidence:.0%})
+
+""")
 
         if c.projected_completion:
-            lines.append(f"**Projected Completion:** ~{c.projected_completion} iterations to reach threshold")
-            lines.append("")
+            w(f"**Projected Completion:** ~{c.projected_completion} iterations to reach threshold\n\n")
 
         if c.indicators:
-            lines.extend([
-                "### Convergence Indicators",
-                "",
-                "| Indicator | Value | Status |",
-                "|-----------|-------|--------|",
-            ])
-            for ind in c.indicators:
-                name = ind.name.replace('_', ' ').title()
-                lines.append(f"| {name} | {ind.value:.3f} | {ind.status} |")
-            lines.append("")
+            w("""### Convergence Indicators
+
+| Indicator | Value | Status |
+|-----------|-------|--------|
+""")
+            w("".join(
+                f"| {ind.name.replace('_', ' ').title()} | {ind.value:.3f} | {ind.status} |\n"
+                for ind in c.indicators
+            ))
+            w("\n")
 
         # Risk factors
         if c.risk_factors:
-            lines.extend([
-                "### Risk Factors",
-                "",
-            ])
-            for risk in c.risk_factors:
-                lines.append(f"- {risk}")
-            lines.append("")
+            w("### Risk Factors\n\n")
+            w("".join(f"- {risk}\n" for risk in c.risk_factors))
+            w("\n")
 
         # Recommendations
         if c.recommendations:
-            lines.extend([
-                "### Recommendations",
-                "",
-            ])
-            for rec in c.recommendations:
-                lines.append(f"- {rec}")
-            lines.append("")
+            w("### Recommendations\n\n")
+            w("".join(f"- {rec}\n" for rec in c.recommendations))
+            w("\n")
 
         # Domain distribution
-        lines.extend([
-            "## Domain Distribution",
-            "",
-        ])
+        w("## Domain Distribution\n\n")
 
         if metrics:
             b = metrics.balance
-            lines.extend([
-                f"- **Domain Entropy:** {b.domain_entropy:.2f} (higher = more balanced)",
-                f"- **Gini Coefficient:** {b.gini_coefficient:.2f} (lower = more equal)",
-            ])
+            w(f"""- **Domain Entropy:** {b.domain_entropy:.2f} (higher = more balanced)
+- **Gini Coefficient:** {b.gini_coefficient:.2f} (lower = more equal)
+""")
             if b.neglected_domains:
-                lines.append(f"- **Neglected Domains:** {', '.join(b.neglected_domains)}")
+                w(f"- **Neglected Domains:** {', '.join(b.neglected_domains)}\n")
             if b.dominant_domains:
-                lines.append(f"- **Dominant Domains:** {', '.join(b.dominant_domains)}")
-            lines.append("")
+                w(f"- **Dominant Domains:** {', '.join(b.dominant_domains)}\n")
+            w("\n")
 
         # Recent primitives
-        lines.extend([
-            "## Recent Additions",
-            "",
-        ])
-
-        for p in report["primitives"]["recent"]:
-            lines.append(f"- **{p['label']}** ({p['domain']}) - {p['id']}")
-        lines.append("")
+        w("## Recent Additions\n\n")
+        w("".join(
+            f"- **{p['label']}** ({p['domain']}) - {p['id']}\n"
+            for p in report["primitives"]["recent"]
+        ))
 
         # Footer
-        lines.extend([
-            "---",
-            "",
-            "*Report generated by ALPHABETUM Analytics*",
-        ])
+        w("""
+---
+
+*Report generated by ALPHABETUM Analytics*""")
 
-        return "\n".join(lines)
+        return buf.getvalue()
 
     def generate_data_export(self, format: str = "csv") -> Path:
         """
@@ -159,6 +159,7 @@ class TestStateManagerIntegration:
         state.phase = Phase.CONSOLIDATION
         state.total_proposed = 5
         state.total_accepted = 2
+        state.recent_verdicts = [True, False]
 
         # Save state
         manager.save_iteration_state(state)
@@ -169,6 +170,7 @@ class TestStateManagerIntegration:
         assert reloaded.phase == Phase.CONSOLIDATION
         assert reloaded.total_proposed == 5
         assert reloaded.total_accepted == 2
+        assert reloaded.recent_verdicts == [True, False]
 
     def test_primitive_lifecycle(self, temp_project):
         """Test creating and loading primitives."""
@@ -310,3 +312,175 @@ class TestCalculusIntegration:
         assert calc.contains(motion, "thing")
         assert calc.contains(motion, "space")
         assert calc.contains(motion, "time")
+
+
+class TestLoopIntegration:
+    """Test the main loop with agents replaced by canned responses."""
+
+    @pytest.fixture
+    def loop(self):
+        from alphabetum.loop.engine import AlphabetumLoop
+
+        tmpdir = tempfile.mkdtemp()
+        base = Path(tmpdir)
+        create_test_project(base)
+        yield AlphabetumLoop(base)
+        shutil.rmtree(tmpdir)
+
+    @staticmethod
+    def make_candidate(label):
+        from alphabetum.state.models import Candidate, Domain
+
+        return Candidate(
+            id="",
+            label=label,
+            domain=Domain.BEING,
+            proposed_symbol=label[0].upper(),
+            informal_definition=f"The concept of {label}.",
+            primitiveness_argument="Cannot be reduced.",
+            decomposition_resistance="High",
+        )
+
+    def test_expansion_phase_keeps_candidate_order(self, loop):
+        """Concurrent critic calls are integrated in proposal order."""
+        import time
+        from alphabetum.state.models import Evaluation, Verdict
+
+        labels = ["thing", "space", "time"]
+
+        def propose(state, **kwargs):
+            return [self.make_candidate(label) for label in labels], "raw"
+
+        def critique(state, candidate, **kwargs):
+            # Finish in reverse order to exercise result ordering
+            time.sleep(0.01 * (len(labels) - labels.index(candidate.label)))
+            verdict = Verdict.REJECT if candidate.label == "space" else Verdict.ACCEPT
+            return Evaluation(candidate_id="", verdict=verdict, confidence=0.8), "raw"
+
+        loop.proposer.execute = propose
+        loop.critic.execute = critique
+        loop.refiner.execute = lambda state, **kwargs: ({}, "raw")
+
+        state = loop.state_manager.load_iteration_state()
+        state = loop._expansion_phase(state)
+
+        primitives = loop.state_manager.load_alphabet_index()
+        assert [p.label for p in primitives] == ["thing", "time"]
+        assert [p.prime for p in primitives] == [2, 3]
+        assert state.total_proposed == 3
+        assert state.total_accepted == 2
+        assert state.total_rejected == 1
+        assert state.recent_verdicts == [True, False, True]
+        assert state.recent_acceptance_rate == pytest.approx(2 / 3)
+
+    def test_alphabet_summary_tracks_index_changes(self, loop):
+        """The cached summary is rebuilt when the index file changes."""
+        from alphabetum.state.models import PrimitiveIndexEntry, Domain, PrimitiveStatus
+
+        assert "empty" in loop._get_alphabet_summary()
+        assert loop._get_alphabet_summary() is loop._get_alphabet_summary()
+
+        loop.state_manager.save_alphabet_index([
+            PrimitiveIndexEntry(
+                id="PRM_0001", label="thing", prime=2, domain=Domain.BEING,
+                status=PrimitiveStatus.RECENT, added_iteration=1, last_reviewed=1, confidence=0.9,
+            ),
+        ], 1)
+        assert "being: thing" in loop._get_alphabet_summary()
+
+    def test_composition_phase_scores_coverage(self, loop):
+        """Coverage and gaps come from the benchmark decomposition hints."""
+        from alphabetum.state.models import PrimitiveIndexEntry, Domain, PrimitiveStatus
+
+        loop.state_manager.save_alphabet_index([
+            PrimitiveIndexEntry(
+                id=f"PRM_{i:04d}", label=label, prime=prime, domain=Domain.BEING,
+                status=PrimitiveStatus.RECENT, added_iteration=1, last_reviewed=1, confidence=0.9,
+            )
+            for i, (label, prime) in enumerate([("thing", 2), ("time", 3)], start=1)
+        ], 1)
+
+        state = loop.state_manager.load_iteration_state()
+        state = loop._composition_phase(state)
+
+        # Both benchmarks match 2 of 3 hints: partial, with the rest as gaps
+        assert state.coverage_score == 0.0
+        assert state.gaps_to_fill == ["state", "space"]
+
+    def test_benchmarks_reloaded_when_file_changes(self, loop):
+        """Benchmarks are parsed once and reparsed after an edit."""
+        first = loop._load_benchmarks()
+        assert loop._load_benchmarks() is first
+
+        path = loop.base_path / "validation" / "benchmarks" / "test_concepts.yaml"
+        with open(path) as f:
+            data = yaml.safe_load(f)
+        with open(path, "w") as f:
+            yaml.dump({"benchmark_concepts": data["benchmark_concepts"][:1]}, f)
+        assert len(loop._load_benchmarks()) == 1
+
+    def test_recent_logs_summary_reads_each_iteration_once(self, loop):
+        """Iteration summaries are read from disk once and then served from memory."""
+        for i in range(3):
+            loop.archivist.log_iteration_summary(i, 2, 1, 1, ["thing"], 0.5)
+        loop.archivist.flush()
+        loop.state_manager.save_log(1, "summary.yaml", {"highlights": ["found time"]})
+
+        text = loop._get_recent_logs_summary(0, 3)
+        assert "Iteration 1: ['found time']" in text
+        assert "Iteration 3" not in text
+
+        loop.state_manager.save_log(1, "summary.yaml", {"highlights": ["changed"]})
+        assert loop._get_recent_logs_summary(0, 3) == text
+
+    def test_advance_state_walks_phases(self, loop):
+        """Phases advance after their configured number of cycles."""
+        from alphabetum.state.models import Phase
+
+        state = loop.state_manager.load_iteration_state()
+        seen = []
+        for _ in range(4):
+            state = loop._advance_state(state)
+            seen.append((state.phase, state.cycle_in_phase))
+
+        assert seen == [
+            (Phase.EXPANSION, 1),
+            (Phase.CONSOLIDATION, 0),
+            (Phase.COMPOSITION, 0),
+            (Phase.META_REFLECTION, 0),
+        ]
+
+    def test_expressiveness_metrics_skipped_when_alphabet_unchanged(self, loop):
+        """Metrics are recomputed only after the alphabet changes."""
+        reports_dir = loop.base_path / "reports" / "expressiveness"
+        state = loop.state_manager.load_iteration_state()
+
+        loop._compute_expressiveness_metrics(state)
+        assert (reports_dir / "iteration_000.yaml").exists()
+
+        state.current_iteration = 1
+        loop._compute_expressiveness_metrics(state)
+        assert not (reports_dir / "iteration_001.yaml").exists()
+
+        loop.state_manager.save_alphabet_index(loop.state_manager.load_alphabet_index(), 2)
+        loop._compute_expressiveness_metrics(state)
+        assert (reports_dir / "iteration_001.yaml").exists()
+
+    def test_alphabet_summary_groups_by_domain(self, loop):
+        """The summary lists labels per domain, domains sorted."""
+        from alphabetum.state.models import PrimitiveIndexEntry, Domain, PrimitiveStatus
+
+        entries = [("thing", Domain.BEING), ("time", Domain.TIME), ("self", Domain.BEING)]
+        summary = loop._build_alphabet_summary([
+            PrimitiveIndexEntry(
+                id=f"PRM_{i:04d}", label=label, prime=2, domain=domain,
+                status=PrimitiveStatus.RECENT, added_iteration=1, last_reviewed=1, confidence=0.9,
+            )
+            for i, (label, domain) in enumerate(entries, start=1)
+        ])
+
+        assert summary == (
+            "Current alphabet has 3 primitives:\n\n"
+            "  being: thing, self\n"
+            "  time: time"
+        )
@@ -0,0 +1,139 @@
+"""Unit tests for the archivist."""
+
+import pytest
+import tempfile
+from pathlib import Path
+import sys
+import shutil
+import yaml
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from alphabetum.logging.archivist import Archivist
+from alphabetum.state.manager import StateManager
+from alphabetum.state.models import Candidate, Domain, Evaluation, Verdict
+
+
+class TestArchivist:
+    """Test Archivist class."""
+
+    @pytest.fixture
+    def state_manager(self):
+        """Create a state manager over a temporary project."""
+        tmpdir = tempfile.mkdtemp()
+        base = Path(tmpdir)
+        (base / "reasoning" / "logs").mkdir(parents=True)
+
+        yield StateManager(base)
+
+        shutil.rmtree(tmpdir)
+
+    @pytest.fixture
+    def evaluation(self):
+        return Evaluation(
+            candidate_id="CAND_001_000",
+            verdict=Verdict.ACCEPT,
+            confidence=0.8,
+            reasoning_summary="Survives decomposition.",
+        )
+
+    def test_critic_log_buffered_until_flush(self, state_manager, evaluation):
+        archivist = Archivist(state_manager)
+        archivist.log_critic(1, "CAND_001_000", evaluation, "raw")
+        archivist.log_critic(1, "CAND_001_001", evaluation, "raw")
+
+        assert state_manager.load_log(1, "critic.yaml") is None
+        assert "CAND_001_000" in state_manager.load_log(1, "critic.md")
+
+        archivist.flush_iteration(1)
+        log = state_manager.load_log(1, "critic.yaml")
+        assert len(log["critic_output"]["evaluations"]) == 2
+
+    def test_flush_preserves_earlier_cycles(self, state_manager, evaluation):
+        first = Archivist(state_manager)
+        first.log_critic(1, "CAND_001_000", evaluation, "raw")
+        first.flush_iteration(1)
+
+        second = Archivist(state_manager)
+        second.log_critic(1, "CAND_001_001", evaluation, "raw")
+        second.flush_iteration(1)
+
+        log = state_manager.load_log(1, "critic.yaml")
+        assert len(log["critic_output"]["evaluations"]) == 2
+
+    def test_rejections_share_one_file_per_iteration(self, state_manager, evaluation):
+        archivist = Archivist(state_manager)
+        for i, label in enumerate(["location", "awareness"]):
+            candidate = Candidate(
+                id=f"CAND_002_{i:03d}",
+                label=label,
+                domain=Domain.SPACE,
+                proposed_symbol="L",
+                informal_definition="Where something is.",
+                primitiveness_argument="Cannot be reduced.",
+                decomposition_resistance="High",
+            )
+            archivist.log_rejection(2, candidate, evaluation)
+
+        path = state_manager.reasoning_path / "rejected" / "iteration_002.yaml"
+        with open(path) as f:
+            documents = list(yaml.safe_load_all(f))
+        assert [d["rejection"]["candidate"]["label"] for d in documents] == ["location", "awareness"]
+
+    def test_log_proposer_writes_both_formats(self, state_manager):
+        candidate = Candidate(
+            id="CAND_003_000",
+            label="duration",
+            domain=Domain.TIME,
+            proposed_symbol="D",
+            informal_definition="x" * 150,
+            ostensive_examples=["a long wait"],
+            primitiveness_argument="Cannot be reduced.",
+            decomposition_resistance="High",
+        )
+        Archivist(state_manager).log_proposer(3, [candidate], "raw response")
+
+        structured = state_manager.load_log(3, "proposer.yaml")["proposer_output"]
+        assert structured["candidates_generated"] == 1
+        assert structured["candidates"][0]["definition_preview"] == "x" * 100 + "..."
+
+        narrative = state_manager.load_log(3, "proposer.md")
+        assert "## Candidate: DURATION" in narrative
+        assert "- a long wait" in narrative
+        assert narrative.endswith("raw response\n```")
+
+    def test_narrative_level_none_skips_markdown(self, state_manager, evaluation):
+        archivist = Archivist(state_manager, narrative_level="none")
+        archivist.log_critic(1, "CAND_001_000", evaluation, "raw")
+        archivist.flush_iteration(1)
+
+        assert state_manager.load_log(1, "critic.md") is None
+        assert state_manager.load_log(1, "critic.yaml") is not None
+
+    def test_background_writes_land_on_flush(self, state_manager, evaluation):
+        archivist = Archivist(state_manager, background=True)
+        for i in range(3):
+            candidate_id = f"CAND_001_{i:03d}"
+            archivist.log_critic(
+                1, candidate_id, evaluation.model_copy(update={"candidate_id": candidate_id}), "raw"
+            )
+        archivist.flush_iteration(1)
+        archivist.flush()
+
+        log = state_manager.load_log(1, "critic.yaml")
+        ids = [e["candidate_id"] for e in log["critic_output"]["evaluations"]]
+        assert ids == ["CAND_001_000", "CAND_001_001", "CAND_001_002"]
+
+    def test_background_write_error_raised_on_flush(self, state_manager, evaluation):
+        archivist = Archivist(state_manager, background=True)
+        shutil.rmtree(state_manager.reasoning_path)
+        (state_manager.base_path / "reasoning").write_text("")
+        archivist.log_critic(1, "CAND_001_000", evaluation, "raw")
+
+        with pytest.raises(OSError):
+            archivist.flush()
+        archivist.flush()
+
+    def test_unknown_narrative_level(self, state_manager):
+        with pytest.raises(ValueError):
+            Archivist(state_manager, narrative_level="verbose")
@@ -31,6 +31,13 @@ class TestConcept:
         assert human.contains(animal)  # Human contains animal
         assert not animal.contains(human)  # Animal doesn't contain human
 
+    def test_concept_is_immutable(self):
+        concept = Concept(name="human", number=35, components=["animal", "rational"])
+        assert concept.components == ("animal", "rational")
+        with pytest.raises(AttributeError):
+            concept.number = 7
+        assert hash(concept) == hash(Concept(name="human", number=35, components=("animal", "rational")))
+
     def test_concept_to_expression(self):
         concept = Concept(
             name="human",
@@ -96,6 +103,21 @@ class TestCalculus:
         assert "rational" in components
         assert len(components) == 2
 
+    def test_extract_repeated_components(self, calculus):
+        concept = Concept(name="x", number=2 * 2 * 11 * 11 * 7, components=[])
+        assert calculus.extract_components(concept) == ("thing", "thing", "rational", "mortal", "mortal")
+
+    def test_extract_ignores_unregistered_factors(self, calculus):
+        # 13 is not a registered prime
+        concept = Concept(name="x", number=13 * 11, components=[])
+        assert calculus.extract_components(concept) == ("mortal",)
+
+    def test_extract_after_new_registration(self, calculus):
+        concept = Concept(name="x", number=5 * 13, components=[])
+        assert calculus.extract_components(concept) == ("animal",)
+        calculus.register_primitive("sensing", 13)
+        assert calculus.extract_components(concept) == ("animal", "sensing")
+
     def test_well_formed_valid(self, calculus):
         human = calculus.compose("animal", "rational")
         valid, violations = calculus.is_well_formed(human)
@@ -108,6 +130,34 @@ class TestCalculus:
         assert not valid
         assert len(violations) > 0
 
+    def test_well_formed_contrast(self, calculus):
+        calculus.register_primitive("nonliving", 13)
+        concept = calculus.compose("living", "nonliving", "animal")
+        valid, violations = calculus.is_well_formed(concept)
+        assert not valid
+        assert violations == ["Contrasting primitives: living and nonliving"]
+
+    def test_well_formed_violations_follow_component_order(self, calculus):
+        calculus.register_primitive("nonliving", 13)
+        calculus.register_contrast("rational", "animal")
+        concept = calculus.compose("rational", "living", "nonliving", "animal")
+        reordered = calculus.compose("living", "nonliving", "rational", "animal")
+
+        assert calculus.is_well_formed(concept)[1] == [
+            "Contrasting primitives: rational and animal",
+            "Contrasting primitives: living and nonliving",
+        ]
+        assert calculus.is_well_formed(reordered)[1] == [
+            "Contrasting primitives: living and nonliving",
+            "Contrasting primitives: rational and animal",
+        ]
+
+    def test_well_formed_after_new_contrast(self, calculus):
+        concept = calculus.compose("animal", "mortal")
+        assert calculus.is_well_formed(concept)[0]
+        calculus.register_contrast("animal", "mortal")
+        assert not calculus.is_well_formed(concept)[0]
+
     def test_find_common_components(self, calculus):
         human = calculus.compose("animal", "rational")
         mortal_animal = calculus.compose("animal", "mortal")
@@ -128,14 +178,15 @@ class TestCalculusEdgeCases:
         calc = Calculus()
         concept = calc.compose()  # No primitives
         assert concept.number == 1
-        assert concept.components == []
+        assert concept.components == ()
 
     def test_duplicate_composition(self):
         calc = Calculus()
         calc.register_primitive("animal", 5)
         concept = calc.compose("animal", "animal")
-        # Should have animal twice in components
-        assert concept.number == 25  # 5 * 5
+        # Composition is idempotent: animal counted once
+        assert concept.number == 5
+        assert concept.components == ("animal",)
 
     def test_large_composition(self):
         calc = Calculus()
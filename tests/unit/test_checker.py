@@ -0,0 +1,289 @@
+"""Unit tests for the alphabet validator."""
+
+import pytest
+import tempfile
+from pathlib import Path
+import sys
+import shutil
+import yaml
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from alphabetum.state.manager import StateManager
+from alphabetum.state.models import (
+    Definition, Domain, PrimitiveDetailed, PrimitiveIndexEntry, PrimitiveStatus,
+    RelationshipGraph, Relationship,
+)
+from alphabetum.validation import checker
+from alphabetum.validation.checker import AlphabetValidator, ValidationResult, _find_cycles
+
+
+def make_primitive(number: int, presupposes: tuple[int, ...] = ()) -> tuple[PrimitiveIndexEntry, PrimitiveDetailed]:
+    """Build matching index and detailed entries for PRM_{number}."""
+    primitive_id = f"PRM_{number:04d}"
+    entry = PrimitiveIndexEntry(
+        id=primitive_id, label=f"label{number}", prime=2, domain=Domain.BEING,
+        status=PrimitiveStatus.RECENT, added_iteration=1, last_reviewed=1, confidence=0.9,
+    )
+    detailed = PrimitiveDetailed(
+        id=primitive_id,
+        symbol="X",
+        label=f"label{number}",
+        definition=Definition(informal="A test primitive"),
+        domain_primary=Domain.BEING,
+        presupposes=[Relationship(id=f"PRM_{n:04d}", label=f"label{n}", reason="test") for n in presupposes],
+        proposed_iteration=1,
+        prime_number=2,
+        confidence=0.9,
+    )
+    return entry, detailed
+
+
+class TestCircularity:
+    """Test circular dependency detection."""
+
+    @pytest.fixture
+    def temp_project(self):
+        tmpdir = tempfile.mkdtemp()
+        base = Path(tmpdir)
+        (base / "alphabet" / "primitives" / "detailed").mkdir(parents=True)
+        (base / "alphabet" / "relationships").mkdir(parents=True)
+
+        manager = StateManager(base)
+        manager.save_alphabet_index([], 0)
+        manager.save_relationships(RelationshipGraph(), 0)
+
+        yield base
+
+        shutil.rmtree(tmpdir)
+
+    def save_primitives(self, base: Path, primitives: list[tuple]) -> None:
+        manager = StateManager(base)
+        manager.save_alphabet_index([entry for entry, _ in primitives], 1)
+        for _, detailed in primitives:
+            manager.save_primitive_detailed(detailed)
+
+    def test_find_cycles_one_per_component(self):
+        adjacency = {
+            "a": ["b"],
+            "b": ["c", "a"],
+            "c": ["a"],
+            "d": ["d"],
+            "e": ["missing"],
+        }
+        assert _find_cycles(adjacency) == [["a", "b"], ["d"]]
+
+    def test_find_cycles_first_only(self):
+        adjacency = {"a": ["b"], "b": ["a"], "c": ["c"]}
+        assert _find_cycles(adjacency, first_only=True) == [["a", "b"]]
+
+    def test_find_cycles_deep_chain(self):
+        # Deeper than the default recursion limit
+        adjacency = {str(i): [str(i + 1)] for i in range(5000)}
+        adjacency["5000"] = ["0"]
+        cycles = _find_cycles(adjacency)
+        assert len(cycles) == 1
+        assert len(cycles[0]) == 5001
+
+    def test_acyclic_alphabet_passes(self, temp_project):
+        self.save_primitives(temp_project, [make_primitive(1), make_primitive(2, (1,))])
+
+        result = AlphabetValidator(temp_project).check_circularity(
+            StateManager(temp_project).load_alphabet_index()
+        )
+        assert result.passed
+        assert result.issues == []
+
+    def test_circular_presupposition_reported(self, temp_project):
+        self.save_primitives(temp_project, [
+            make_primitive(1, (2,)),
+            make_primitive(2, (1,)),
+            make_primitive(3, (1,)),
+        ])
+
+        result = AlphabetValidator(temp_project).check_circularity(
+            StateManager(temp_project).load_alphabet_index()
+        )
+        assert not result.passed
+        assert result.issues == [
+            {"type": "circular_dependency", "cycle": ["PRM_0001", "PRM_0002"], "severity": "critical"}
+        ]
+
+    def test_quick_check_stops_at_cycle(self, temp_project):
+        self.save_primitives(temp_project, [make_primitive(1, (2,)), make_primitive(2, (1,))])
+        StateManager(temp_project).save_relationships(
+            RelationshipGraph(presupposes=[{"source": "PRM_0001", "target": "PRM_0009"}]), 1
+        )
+
+        result = AlphabetValidator(temp_project).run_quick_check()
+        assert not result.passed
+        assert [i["type"] for i in result.issues] == ["circular_dependency"]
+
+    def test_full_validation_builds_id_set_once(self, temp_project, monkeypatch):
+        self.save_primitives(temp_project, [make_primitive(1), make_primitive(2, (1,))])
+        StateManager(temp_project).save_relationships(
+            RelationshipGraph(
+                contrasts=[("PRM_0001", "PRM_0009")],
+                presupposes=[{"source": "PRM_0002", "target": "PRM_0009"}],
+            ),
+            1,
+        )
+        calls = []
+
+        def counting_ids(primitives):
+            calls.append(len(primitives))
+            return frozenset(p.id for p in primitives)
+
+        monkeypatch.setattr(checker, "_primitive_ids", counting_ids)
+        results = AlphabetValidator(temp_project).run_full_validation()
+
+        assert calls == [2]
+        assert [i["missing"] for i in results["contrast"].issues] == ["PRM_0009"]
+        assert [i["missing_target"] for i in results["presupposition"].issues] == ["PRM_0009"]
+
+
+class TestCoverage:
+    """Test benchmark coverage."""
+
+    @pytest.fixture
+    def temp_project(self):
+        tmpdir = tempfile.mkdtemp()
+        base = Path(tmpdir)
+        (base / "alphabet" / "primitives").mkdir(parents=True)
+        (base / "validation" / "benchmarks").mkdir(parents=True)
+
+        benchmarks = {
+            "benchmark_concepts": [
+                {"name": "change", "domain": "metaphysics", "decomposition_hints": ["label1", "time", "state"]},
+                {"name": "motion", "domain": "physics", "decomposition_hints": ["space", "time", "label1"]},
+                {"name": "being", "domain": "metaphysics", "decomposition_hints": ["label1"]},
+                {"name": "duty", "domain": "ethics", "decomposition_hints": ["ought", "agent", "time"]},
+            ]
+        }
+        with open(base / "validation" / "benchmarks" / "test_concepts.yaml", "w") as f:
+            yaml.dump(benchmarks, f)
+
+        manager = StateManager(base)
+        manager.save_alphabet_index([make_primitive(1)[0]], 1)
+
+        yield base
+
+        shutil.rmtree(tmpdir)
+
+    def test_coverage_counts_and_gaps(self, temp_project):
+        validator = AlphabetValidator(temp_project)
+        coverage = validator.check_coverage_only()
+
+        assert (coverage.total, coverage.expressible, coverage.partial, coverage.inexpressible) == (4, 1, 2, 1)
+        assert coverage.coverage_score == 0.25
+        assert coverage.gaps == [
+            {"label": "time", "count": 3},
+            {"label": "state", "count": 1},
+            {"label": "space", "count": 1},
+            {"label": "ought", "count": 1},
+            {"label": "agent", "count": 1},
+        ]
+        assert coverage.details[0]["missing"] == ["time", "state"]
+        assert coverage.details[2]["missing"] == []
+
+    def test_benchmarks_reparsed_only_when_changed(self, temp_project):
+        validator = AlphabetValidator(temp_project)
+        first = validator._load_benchmarks()
+        assert validator._load_benchmarks() is first
+
+        benchmarks_file = temp_project / "validation" / "benchmarks" / "test_concepts.yaml"
+        with open(benchmarks_file, "w") as f:
+            yaml.dump({"benchmark_concepts": [{"name": "time", "decomposition_hints": ["label1"]}]}, f)
+        assert validator.check_coverage_only().expressible == 1
+
+
+class TestReferences:
+    """Test contrast and presupposition references."""
+
+    @pytest.fixture
+    def validator(self):
+        tmpdir = tempfile.mkdtemp()
+        yield AlphabetValidator(Path(tmpdir))
+        shutil.rmtree(tmpdir)
+
+    def primitives(self, count: int) -> list[PrimitiveIndexEntry]:
+        return [make_primitive(n)[0] for n in range(1, count + 1)]
+
+    def test_contrasts_report_each_missing_end(self, validator):
+        graph = RelationshipGraph(contrasts=[("PRM_0001", "PRM_0002"), ("PRM_0001", "PRM_0009")])
+
+        result = validator.check_contrasts(self.primitives(2), graph)
+        assert not result.passed
+        assert [i["missing"] for i in result.issues] == ["PRM_0009"]
+
+    def test_orphaned_presupposition(self, validator):
+        graph = RelationshipGraph(presupposes=[
+            {"source": "PRM_0002", "target": "PRM_0001"},
+            {"source": "PRM_0002", "target": "PRM_0009"},
+        ])
+
+        result = validator.check_presuppositions(self.primitives(2), graph)
+        assert [i["missing_target"] for i in result.issues] == ["PRM_0009"]
+
+
+class TestDomains:
+    """Test domain grouping checks."""
+
+    @pytest.fixture
+    def validator(self):
+        tmpdir = tempfile.mkdtemp()
+        yield AlphabetValidator(Path(tmpdir))
+        shutil.rmtree(tmpdir)
+
+    def primitives(self, domains: list[Domain]) -> list[PrimitiveIndexEntry]:
+        entry = make_primitive(1)[0]
+        return [
+            entry.model_copy(update={"id": f"PRM_{i:04d}", "domain": domain})
+            for i, domain in enumerate(domains)
+        ]
+
+    def test_domain_balance(self, validator):
+        result = validator.check_domain_balance(self.primitives([Domain.BEING] * 4 + [Domain.SPACE]))
+
+        assert result.score == 0.25
+        assert not result.passed
+        sparse = [i["domain"] for i in result.issues if i["type"] == "sparse_domain"]
+        assert sparse == ["space"]
+        assert len([i for i in result.issues if i["type"] == "neglected_domain"]) == len(Domain) - 2
+
+    def test_empty_alphabet_is_unbalanced(self, validator):
+        result = validator.check_domain_balance([])
+        assert result.score == 0.0
+
+    def test_redundancy_flags_crowded_domain(self, validator):
+        result = validator.check_redundancy(self.primitives([Domain.MIND] * 11 + [Domain.TIME]))
+
+        assert [(i["domain"], i["count"]) for i in result.issues] == [("mind", 11)]
+        assert result.passed
+
+
+class TestReport:
+    """Test validation report generation."""
+
+    def test_report_formats_agree(self):
+        results = {
+            "circularity": ValidationResult(passed=True, score=1.0),
+            "coverage": ValidationResult(
+                passed=False,
+                score=0.25,
+                issues=[{"gap": f"gap{i}"} for i in range(7)],
+                recommendations=["Expand the alphabet"],
+            ),
+        }
+        yaml_report, markdown = AlphabetValidator(Path(".")).generate_report(results, 3)
+
+        report = yaml_report["validation_report"]
+        assert report["overall_score"] == 0.625
+        assert not report["overall_passed"]
+        assert report["checks"]["coverage"] == {"passed": False, "score": 0.25, "issues_count": 7}
+
+        assert f"**Generated:** {report['timestamp']}" in markdown
+        assert "| Coverage | Fail | 0.25 |" in markdown
+        assert "- {'gap': 'gap4'}" in markdown
+        assert "gap5" not in markdown
+        assert "- Expand the alphabet" in markdown
@@ -0,0 +1,83 @@
+"""Unit tests for the CRITIC agent."""
+
+import pytest
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from alphabetum.agents.critic import CriticAgent
+from alphabetum.state.models import Candidate, Domain, Verdict
+
+
+CONFIG = {
+    "llm": {"provider": "anthropic", "model": "test", "max_tokens": 1000},
+    "temperatures": {"critic": 0.3},
+}
+
+BATCH_RESPONSE = """
+```yaml
+evaluations:
+  - candidate_id: "CAND_001_000"
+    verdict: "ACCEPT"
+    confidence: 0.9
+    decomposition:
+      attempts:
+        - approach: "analytic"
+          attempt: "define via location"
+          result: "circular"
+          survived: true
+      survived: true
+  - evaluation:
+      candidate_id: "CAND_001_001"
+      verdict: "REFINE"
+      confidence: 0.4
+```
+"""
+
+
+class TestCriticBatch:
+    """Test batched evaluation parsing."""
+
+    @pytest.fixture
+    def critic(self):
+        return CriticAgent(CONFIG)
+
+    @staticmethod
+    def make_candidate(i, label):
+        return Candidate(
+            id=f"CAND_001_{i:03d}",
+            label=label,
+            domain=Domain.SPACE,
+            proposed_symbol=label[0].upper(),
+            informal_definition=f"The concept of {label}.",
+            primitiveness_argument="Cannot be reduced.",
+            decomposition_resistance="High",
+        )
+
+    def test_parse_batch_response(self, critic):
+        evaluations = critic.parse_batch_response(BATCH_RESPONSE)
+
+        assert set(evaluations) == {"CAND_001_000", "CAND_001_001"}
+        assert evaluations["CAND_001_000"].verdict == Verdict.ACCEPT
+        assert len(evaluations["CAND_001_000"].decomposition_attacks) == 1
+        assert evaluations["CAND_001_001"].verdict == Verdict.REFINE
+
+    def test_parse_batch_response_invalid_yaml(self, critic):
+        assert critic.parse_batch_response("evaluations: [unclosed") == {}
+
+    def test_execute_batch_aligns_with_candidates(self, critic):
+        candidates = [self.make_candidate(i, l) for i, l in enumerate(["place", "size", "shape"])]
+        prompts = []
+
+        def call_llm(system_prompt, user_prompt):
+            prompts.append(user_prompt)
+            return BATCH_RESPONSE
+
+        critic.call_llm = call_llm
+        evaluations, raw = critic.execute_batch(None, candidates, alphabet_summary="empty")
+
+        assert len(prompts) == 1
+        assert all(f'id: "{c.id}"' in prompts[0] for c in candidates)
+        assert [e and e.verdict for e in evaluations] == [Verdict.ACCEPT, Verdict.REFINE, None]
+        assert raw == BATCH_RESPONSE
@@ -0,0 +1,75 @@
+"""Unit tests for analytics metrics."""
+
+import pytest
+from datetime import datetime
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from alphabetum.analytics.history import IterationSnapshot
+from alphabetum.analytics.metrics import MetricsCalculator
+
+
+class StaticHistory:
+    """Minimal history source returning a fixed list of snapshots."""
+
+    def __init__(self, snapshots: list[IterationSnapshot]):
+        self._snapshots = snapshots
+
+    def get_snapshots(self) -> list[IterationSnapshot]:
+        return self._snapshots.copy()
+
+
+def make_snapshots(added: list[int], proposed: list[int]) -> list[IterationSnapshot]:
+    """Build snapshots from per-iteration added/proposed counts."""
+    snapshots = []
+    total = 0
+    cumulative_proposed = 0
+    for i, (a, p) in enumerate(zip(added, proposed)):
+        total += a
+        cumulative_proposed += p
+        snapshots.append(IterationSnapshot(
+            iteration=i,
+            timestamp=datetime(2024, 1, 1),
+            total_primitives=total,
+            primitives_added=a,
+            primitives_rejected=p - a,
+            candidates_proposed=cumulative_proposed,
+            acceptance_rate=a / p if p else 0,
+            cumulative_acceptance_rate=total / cumulative_proposed if cumulative_proposed else 0,
+            coverage_score=0.0,
+            coverage_delta=0.0,
+        ))
+    return snapshots
+
+
+class TestEfficiencyMetrics:
+    """Test efficiency calculations."""
+
+    def test_recent_acceptance_rate(self):
+        snapshots = make_snapshots([1, 2, 2], [4, 4, 4])
+        calc = MetricsCalculator(StaticHistory(snapshots))
+        efficiency = calc._calculate_efficiency(snapshots)
+        assert efficiency.acceptance_rate == pytest.approx(5 / 12)
+
+    def test_acceptance_trend_uses_actual_proposals(self):
+        # Earlier window: 5/10 accepted; recent window: 5/20 accepted
+        snapshots = make_snapshots([1] * 10, [2] * 5 + [4] * 5)
+        calc = MetricsCalculator(StaticHistory(snapshots))
+        efficiency = calc._calculate_efficiency(snapshots)
+        assert efficiency.acceptance_rate == pytest.approx(0.25)
+        assert efficiency.acceptance_trend == "declining"
+
+
+class TestGrowthMetrics:
+    """Test growth calculations."""
+
+    def test_growth_rate_and_acceleration(self):
+        snapshots = make_snapshots([1] * 5 + [3] * 5, [4] * 10)
+        calc = MetricsCalculator(StaticHistory(snapshots))
+        growth = calc._calculate_growth(snapshots)
+        assert growth.total_primitives == 20
+        assert growth.growth_rate == pytest.approx(3.0)
+        assert growth.growth_acceleration == pytest.approx(2.0)
+        assert growth.velocity_trend == "accelerating"
@@ -0,0 +1,82 @@
+"""Unit tests for plot helpers."""
+
+import pytest
+import tempfile
+from datetime import datetime
+from pathlib import Path
+import sys
+import shutil
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+pytest.importorskip("matplotlib")
+
+from alphabetum.analytics.history import HistoryTracker, IterationSnapshot
+from alphabetum.state.manager import StateManager
+from alphabetum.viz.plots import AlphabetumPlotter, _rolling_mean_std
+
+
+def naive_rolling(values: list[float], window: int) -> tuple[list[float], list[float]]:
+    """Reference trailing-window mean and population std."""
+    means, stds = [], []
+    for i in range(len(values)):
+        data = values[max(0, i - window + 1):i + 1]
+        mean = sum(data) / len(data)
+        means.append(mean)
+        stds.append((sum((x - mean) ** 2 for x in data) / len(data)) ** 0.5)
+    return means, stds
+
+
+class TestRollingStats:
+    """Test the cumulative-sum rolling statistics."""
+
+    @pytest.mark.parametrize("window", [1, 3, 5, 20])
+    def test_matches_naive_windows(self, window):
+        values = [12.5, 40.0, 37.5, 61.0, 55.0, 80.0, 72.5, 90.0]
+        mean, std = _rolling_mean_std(values, window)
+        expected_mean, expected_std = naive_rolling(values, window)
+
+        assert mean.tolist() == pytest.approx(expected_mean)
+        assert std.tolist() == pytest.approx(expected_std, abs=1e-6)
+
+    def test_constant_series_has_zero_std(self):
+        _, std = _rolling_mean_std([33.3] * 10, 3)
+        assert (std >= 0).all()
+        assert std.tolist() == pytest.approx([0.0] * 10, abs=1e-6)
+
+
+class TestGenerateAll:
+    """Test rendering the full figure set."""
+
+    @pytest.fixture
+    def history(self):
+        tmpdir = tempfile.mkdtemp()
+        tracker = HistoryTracker(StateManager(Path(tmpdir)))
+        tracker._snapshots = [
+            IterationSnapshot(
+                iteration=i,
+                timestamp=datetime(2024, 1, 1),
+                total_primitives=2 * i,
+                primitives_added=2,
+                primitives_rejected=1,
+                candidates_proposed=3 * (i + 1),
+                acceptance_rate=2 / 3,
+                cumulative_acceptance_rate=2 * i / (3 * (i + 1)),
+                coverage_score=i / 10,
+                coverage_delta=0.1,
+                domain_counts={"being": i, "time": i},
+            )
+            for i in range(5)
+        ]
+
+        yield tracker
+
+        shutil.rmtree(tmpdir)
+
+    def test_pool_matches_serial(self, history):
+        serial = AlphabetumPlotter(history, history.base_path / "serial", export_dpi=50).generate_all()
+        pooled = AlphabetumPlotter(history, history.base_path / "pooled", export_dpi=50).generate_all(workers=2)
+
+        assert [p.name for p in pooled] == [p.name for p in serial]
+        assert len(serial) == 6
+        assert all(p.exists() for p in pooled)
@@ -5,10 +5,11 @@ import tempfile
 from pathlib import Path
 import sys
 import shutil
+import yaml
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
 
-from alphabetum.state.manager import StateManager
+from alphabetum.state.manager import StateManager, _primes_up_to
 from alphabetum.state.models import (
     IterationState, Phase, Domain, PrimitiveStatus,
     PrimitiveIndexEntry, PrimitiveDetailed, Definition
@@ -119,6 +120,72 @@ class TestStateManager:
         assert reloaded.current_iteration == 5
         assert reloaded.phase == Phase.CONSOLIDATION
 
+    def test_state_delta_replayed_on_load(self, temp_project):
+        manager = StateManager(temp_project)
+        state = manager.load_iteration_state()
+
+        state.cycle_in_phase = 1
+        state.total_proposed = 3
+        manager.append_state_delta(state)
+        state.total_proposed = 6
+        manager.append_state_delta(state)
+        with open(manager.reasoning_path / "iteration_state.journal", "a") as f:
+            f.write('{"cycle_in')  # torn write
+
+        reloaded = manager.load_iteration_state()
+        assert reloaded.cycle_in_phase == 1
+        assert reloaded.total_proposed == 6
+        assert reloaded.phase == Phase.EXPANSION
+
+    def test_save_iteration_state_clears_deltas(self, temp_project):
+        manager = StateManager(temp_project)
+        state = manager.load_iteration_state()
+        state.total_proposed = 3
+        manager.append_state_delta(state)
+
+        state.total_proposed = 4
+        manager.save_iteration_state(state)
+
+        assert not (manager.reasoning_path / "iteration_state.journal").exists()
+        assert manager.load_iteration_state().total_proposed == 4
+
+    def test_unchanged_state_save_skips_write(self, temp_project):
+        manager = StateManager(temp_project)
+        state_file = manager.reasoning_path / "iteration_state.yaml"
+        state = manager.load_iteration_state()
+        state.current_iteration = 3
+        manager.save_iteration_state(state)
+        written = state_file.read_text()
+
+        # Only last_updated would change
+        manager.save_iteration_state(state)
+        assert state_file.read_text() == written
+
+        # A rewrite by another tool is overwritten on the next save
+        state_file.write_text(written.replace("current_iteration: 3", "current_iteration: 12"))
+        manager.save_iteration_state(state)
+        assert manager.load_iteration_state().current_iteration == 3
+        assert not state_file.with_suffix(".yaml.tmp").exists()
+
+    def test_state_delta_ignored_after_external_rewrite(self, temp_project):
+        import yaml
+
+        manager = StateManager(temp_project)
+        state = manager.load_iteration_state()
+        state.total_proposed = 3
+        manager.append_state_delta(state)
+
+        state_file = manager.reasoning_path / "iteration_state.yaml"
+        with open(state_file) as f:
+            data = yaml.safe_load(f)
+        data["iteration_state"]["current_iteration"] = 12
+        with open(state_file, "w") as f:
+            yaml.dump(data, f)
+
+        reloaded = manager.load_iteration_state()
+        assert reloaded.current_iteration == 12
+        assert reloaded.total_proposed == 0
+
     def test_load_empty_alphabet(self, temp_project):
         manager = StateManager(temp_project)
         primitives = manager.load_alphabet_index()
@@ -158,6 +225,76 @@ class TestStateManager:
         assert loaded[0].label == "existence"
         assert loaded[1].label == "space"
 
+    def test_index_roundtrip_keeps_symbol_and_definition(self, temp_project):
+        entry = PrimitiveIndexEntry(
+            id="PRM_0001", label="existence", prime=2, domain=Domain.BEING,
+            status=PrimitiveStatus.STABLE, added_iteration=0, symbol="∃",
+            brief_definition="The bare fact that something IS.",
+        )
+        StateManager(temp_project).save_alphabet_index([entry], 1)
+
+        assert StateManager(temp_project).load_alphabet_index() == [entry]
+
+    def test_index_statistics(self, temp_project):
+        manager = StateManager(temp_project)
+        base = PrimitiveIndexEntry(
+            id="PRM_0001", label="existence", prime=2, domain=Domain.SPACE,
+            status=PrimitiveStatus.RECENT, added_iteration=1, last_reviewed=1, confidence=0.9,
+        )
+        manager.save_alphabet_index([
+            base,
+            base.model_copy(update={"id": "PRM_0002", "prime": 3, "domain": Domain.BEING}),
+            base.model_copy(update={"id": "PRM_0003", "prime": 5, "status": PrimitiveStatus.DEPRECATED}),
+        ], 1)
+
+        with open(temp_project / "alphabet" / "primitives" / "index.yaml") as f:
+            stats = yaml.safe_load(f)["alphabet_index"]["statistics"]
+        assert stats["total_primitives"] == 3
+        assert list(stats["by_domain"].items()) == [("space", 2), ("being", 1)]
+        assert stats["by_status"] == {"stable": 0, "recent": 2, "contested": 0}
+
+    def test_alphabet_index_cached_until_file_changes(self, temp_project):
+        manager = StateManager(temp_project)
+        first = manager.load_alphabet_index()
+        first.append("not saved")
+        assert manager.load_alphabet_index() == []
+
+        entry = PrimitiveIndexEntry(
+            id="PRM_0001",
+            label="existence",
+            prime=2,
+            domain=Domain.BEING,
+            status=PrimitiveStatus.RECENT,
+            added_iteration=1,
+            last_reviewed=1,
+            confidence=0.9,
+        )
+        manager.save_alphabet_index([entry], 1)
+        assert manager.load_alphabet_index() == [entry]
+
+        # Another manager writing the same project is picked up
+        second = entry.model_copy(update={"id": "PRM_0002", "prime": 3})
+        StateManager(temp_project).save_alphabet_index([entry, second], 2)
+        assert [p.prime for p in manager.load_alphabet_index()] == [2, 3]
+
+    def test_primitive_labels_follow_index(self, temp_project):
+        manager = StateManager(temp_project)
+        assert manager.load_primitive_labels() == frozenset()
+
+        manager.save_alphabet_index([
+            PrimitiveIndexEntry(
+                id="PRM_0001",
+                label="existence",
+                prime=2,
+                domain=Domain.BEING,
+                status=PrimitiveStatus.RECENT,
+                added_iteration=1,
+                last_reviewed=1,
+                confidence=0.9,
+            ),
+        ], 1)
+        assert manager.load_primitive_labels() == {"existence"}
+
     def test_save_detailed_primitive(self, temp_project):
         manager = StateManager(temp_project)
 
@@ -187,6 +324,51 @@ class TestStateManager:
         assert loaded.label == "existence"
         assert loaded.definition.informal == "The quality of being or existing"
 
+    def test_load_detailed_by_id_prefix(self, temp_project):
+        manager = StateManager(temp_project)
+        detailed = PrimitiveDetailed(
+            id="PRM_0001",
+            symbol="E",
+            label="first_cause",
+            definition=Definition(informal="That which causes without being caused"),
+            domain_primary=Domain.CAUSATION,
+            proposed_iteration=1,
+            accepted_iteration=1,
+            prime_number=2,
+            confidence=0.9,
+        )
+        manager.save_primitive_detailed(detailed)
+        assert manager.load_primitive_detailed("PRM_0001").label == "first_cause"
+        assert manager.load_primitive_detailed("PRM_0010") is None
+
+        # A file added after the first lookup is still found
+        manager.save_primitive_detailed(
+            detailed.model_copy(update={"id": "PRM_0010", "label": "motion"})
+        )
+        assert manager.load_primitive_detailed("PRM_0010").label == "motion"
+
+    def test_load_all_primitives_detailed(self, temp_project):
+        manager = StateManager(temp_project)
+        entry = PrimitiveIndexEntry(
+            id="PRM_0001", label="existence", prime=2, domain=Domain.BEING,
+            status=PrimitiveStatus.RECENT, added_iteration=1, last_reviewed=1, confidence=0.9,
+        )
+        manager.save_alphabet_index([entry, entry.model_copy(update={"id": "PRM_0002", "prime": 3})], 1)
+        manager.save_primitive_detailed(PrimitiveDetailed(
+            id="PRM_0001",
+            symbol="E",
+            label="existence",
+            definition=Definition(informal="The quality of being or existing"),
+            domain_primary=Domain.BEING,
+            proposed_iteration=1,
+            prime_number=2,
+            confidence=0.9,
+        ))
+
+        detailed = manager.load_all_primitives_detailed()
+        assert list(detailed) == ["PRM_0001"]
+        assert detailed["PRM_0001"].label == "existence"
+
     def test_get_next_prime(self, temp_project):
         manager = StateManager(temp_project)
 
@@ -209,19 +391,22 @@ class TestStateManager:
         # Next prime after 3 is 5
         assert manager.get_next_prime() == 5
 
-    def test_is_prime(self, temp_project):
+    def test_get_next_prime_beyond_sieve_start(self, temp_project):
         manager = StateManager(temp_project)
+        manager.save_alphabet_index([
+            PrimitiveIndexEntry(
+                id="PRM_0001", label="test1", prime=4093, domain=Domain.BEING,
+                status=PrimitiveStatus.RECENT, added_iteration=1, last_reviewed=1, confidence=0.9,
+            ),
+        ], 1)
 
-        assert manager._is_prime(2)
-        assert manager._is_prime(3)
-        assert manager._is_prime(5)
-        assert manager._is_prime(7)
-        assert manager._is_prime(11)
-        assert not manager._is_prime(4)
-        assert not manager._is_prime(6)
-        assert not manager._is_prime(9)
-        assert not manager._is_prime(1)
-        assert not manager._is_prime(0)
+        # 4099 lies past the initial sieve bound of 4096
+        assert manager.get_next_prime() == 4099
+
+    def test_primes_up_to(self):
+        assert _primes_up_to(12) == [2, 3, 5, 7, 11]
+        assert _primes_up_to(2) == [2]
+        assert _primes_up_to(1) == []
 
     def test_load_relationships(self, temp_project):
         manager = StateManager(temp_project)
@@ -230,6 +415,15 @@ class TestStateManager:
         assert graph.version == "1.0.0"
         assert len(graph.contrasts) == 0
 
+    def test_save_relationships_roundtrip(self, temp_project):
+        manager = StateManager(temp_project)
+        graph = manager.load_relationships()
+        graph.contrasts.append(("PRM_0001", "PRM_0002"))
+        manager.save_relationships(graph, 1)
+
+        reloaded = manager.load_relationships()
+        assert reloaded.contrasts == [("PRM_0001", "PRM_0002")]
+
     def test_save_log(self, temp_project):
         manager = StateManager(temp_project)
 
@@ -11,6 +11,7 @@ import typer
 from rich.console import Console
 from rich.table import Table
 
+from alphabetum.logging import setup_console_logging
 from alphabetum.loop.engine import AlphabetumLoop
 from alphabetum.state.manager import StateManager
 from alphabetum.validation.checker import AlphabetValidator
@@ -26,6 +27,7 @@ console = Console()
 def run(
     path: Path = typer.Option(".", help="Path to alphabet repository"),
     iterations: int = typer.Option(10, help="Maximum iterations to run"),
+    quiet: bool = typer.Option(False, help="Only show warnings from the loop"),
 ):
     """Run the ALPHABETUM loop."""
     console.print(f"[bold blue]ALPHABETUM[/bold blue] - Starting autonomous reasoning loop")
@@ -33,8 +35,12 @@ def run(
     console.print(f"Max iterations: {iterations}")
     console.print()
 
-    loop = AlphabetumLoop(path)
-    report = loop.run(max_iterations=iterations)
+    listener = setup_console_logging(quiet=quiet)
+    try:
+        loop = AlphabetumLoop(path)
+        report = loop.run(max_iterations=iterations)
+    finally:
+        listener.stop()
 
     console.print()
     console.print("[bold green]Run completed![/bold green]")